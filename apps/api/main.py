@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import datetime as dt
+import logging
 from typing import Any
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -24,6 +25,8 @@ from core.schemas import (
 from core.preview import business_preview_store, rfp_preview_store
 
 
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
 app = FastAPI(title="DataForge", version="0.1.0")
 
 app.add_middleware(
@@ -39,7 +42,7 @@ app.add_middleware(
 def healthcheck() -> HealthResponse:
     """Simple health endpoint."""
 
-    return HealthResponse(ok=True, ts=dt.datetime.utcnow())
+    return HealthResponse(ok=True, ts=dt.datetime.now(dt.UTC))
 
 
 @app.post("/pull/business", response_model=DataForgeResponse)
@@ -77,22 +80,33 @@ def get_preview_query(
     return PreviewQuery(page=page, page_size=page_size)
 
 
+def _preview_page(store: Any, query: PreviewQuery, request: Request) -> Response:
+    """Serve a preview page, answering 304 when the client already has it."""
+
+    etag = store.etag(query)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    # The store serializes each page once; returning the bytes directly skips
+    # FastAPI re-validating and re-encoding the response model per request
+    return Response(content=store.list_records_json(query), media_type="application/json", headers={"ETag": etag})
+
+
 @app.get("/preview/business", response_model=BusinessPreviewResponse)
 def preview_business(
+    request: Request,
     query: PreviewQuery = Depends(get_preview_query),
     store=Depends(lambda: business_preview_store),
 ) -> Any:
-    page = store.list_records(query)
-    return page
+    return _preview_page(store, query, request)
 
 
 @app.get("/preview/rfps", response_model=RFPPreviewResponse)
 def preview_rfps(
+    request: Request,
     query: PreviewQuery = Depends(get_preview_query),
     store=Depends(lambda: rfp_preview_store),
 ) -> Any:
-    page = store.list_records(query)
-    return page
+    return _preview_page(store, query, request)
 
 
 @app.exception_handler(ValueError)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import logging
 from typing import Optional
 
 import typer
 
+from core.config import settings
 from core.pipeline.business import run_business_pipeline
 from core.pipeline.rfp import run_rfp_pipeline
 from core.schemas import BusinessPullRequest, RFPPullRequest
@@ -15,6 +16,15 @@ from core.schemas import BusinessPullRequest, RFPPullRequest
 app = typer.Typer(help="DataForge CLI")
 
 
+@app.callback()
+def configure(verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging")) -> None:
+    # Logs go to stderr so stdout stays pure JSON
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+
 def parse_list(value: str | None) -> list[str] | None:
     if not value:
         return None
@@ -30,6 +40,7 @@ def biz_pull(
     min_years: Optional[int] = typer.Option(None),
     max_years: Optional[int] = typer.Option(None),
     enable_geocoder: bool = typer.Option(False, help="Enable Census geocoder"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk Census geocoder cache"),
     small_business_only: bool = typer.Option(False, help="Filter for small businesses only"),
     business_size: Optional[str] = typer.Option(None, help="Specific business size: micro, small, medium, large"),
 ) -> None:
@@ -44,8 +55,15 @@ def biz_pull(
         small_business_only=small_business_only,
         business_size=business_size,
     )
-    result = run_business_pipeline(payload)
-    typer.echo(json.dumps(result.model_dump(), indent=2, default=str))
+    # Scoped to this run so the shared settings are left as they were
+    cache_enabled = settings.census_cache_enabled
+    if no_cache:
+        settings.census_cache_enabled = False
+    try:
+        result = run_business_pipeline(payload)
+    finally:
+        settings.census_cache_enabled = cache_enabled
+    typer.echo(result.model_dump_json(indent=2))
 
 
 @app.command("rfp")
@@ -66,7 +84,7 @@ def rfp_pull(
         limit=limit,
     )
     result = run_rfp_pipeline(payload)
-    typer.echo(json.dumps(result.model_dump(), indent=2, default=str))
+    typer.echo(result.model_dump_json(indent=2))
 
 
 def main() -> None:
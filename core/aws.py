@@ -2,14 +2,47 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from core.config import settings
+# core.config imports this module while configuring AWS, so ``settings`` is
+# imported where it is used rather than at module level.
+
+
+logger = logging.getLogger(__name__)
+
+
+# Successful GetSecretValue results are reused across SecretsManager instances
+# (and Lambda warm invocations) until they expire.
+SECRET_CACHE_TTL_SECONDS = 900
+_secret_cache: Dict[str, Tuple[float, str]] = {}
+
+
+@lru_cache(maxsize=1)
+def _session() -> boto3.Session:
+    return boto3.Session()
+
+
+@lru_cache(maxsize=None)
+def _client(service_name: str):
+    """Shared boto3 client per service; clients are thread-safe and reuse connections."""
+    from core.config import settings
+    config = Config(
+        max_pool_connections=settings.aws_max_pool_connections,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+    )
+    return _session().client(service_name, config=config)
 
 
 class S3Exporter:
@@ -17,7 +50,15 @@ class S3Exporter:
     
     def __init__(self, bucket_name: Optional[str] = None):
         self.bucket_name = bucket_name or os.getenv("DATAFORGE_S3_BUCKET")
-        self.s3_client = boto3.client('s3') if self.bucket_name else None
+        self.s3_client = _client('s3') if self.bucket_name else None
+        from core.config import settings
+        # Multipart uploads send 8 MiB parts over concurrent connections
+        self._transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=settings.s3_max_concurrency,
+            use_threads=True,
+        )
     
     def upload_file(self, local_path: Path, s3_key: str) -> str:
         """Upload file to S3 and return public URL."""
@@ -28,13 +69,44 @@ class S3Exporter:
             self.s3_client.upload_file(
                 str(local_path), 
                 self.bucket_name, 
-                s3_key
+                s3_key,
+                Config=self._transfer_config,
             )
             return f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}"
-        except ClientError as e:
-            print(f"Failed to upload to S3: {e}")
+        except (ClientError, S3UploadFailedError) as e:
+            logger.error("Failed to upload to S3: %s", e)
             return str(local_path)  # Fallback to local path
     
+    def upload_fileobj(
+        self, fileobj: BinaryIO, s3_key: str, extra_args: Optional[Dict[str, str]] = None
+    ) -> Optional[str]:
+        """Stream an open binary file to S3; returns the URL, or None if not uploaded."""
+        if not self.s3_client:
+            return None
+        
+        try:
+            self.s3_client.upload_fileobj(
+                fileobj,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs=extra_args,
+                Config=self._transfer_config,
+            )
+            return f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}"
+        except (ClientError, S3UploadFailedError) as e:
+            logger.error("Failed to upload to S3: %s", e)
+            return None
+    
+    def upload_files(
+        self, uploads: List[Tuple[BinaryIO, str, Optional[Dict[str, str]]]]
+    ) -> List[Optional[str]]:
+        """Stream several ``(fileobj, s3_key, extra_args)`` uploads in parallel; URLs (or None) in input order."""
+        if not self.s3_client or len(uploads) <= 1:
+            return [self.upload_fileobj(*upload) for upload in uploads]
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(uploads))) as executor:
+            return list(executor.map(lambda upload: self.upload_fileobj(*upload), uploads))
+    
     def download_file(self, s3_key: str, local_path: Path) -> bool:
         """Download file from S3."""
         if not self.s3_client:
@@ -44,41 +116,54 @@ class S3Exporter:
             self.s3_client.download_file(self.bucket_name, s3_key, str(local_path))
             return True
         except ClientError as e:
-            print(f"Failed to download from S3: {e}")
+            logger.error("Failed to download from S3: %s", e)
             return False
 
 
+@lru_cache(maxsize=1)
+def _rds_connection_string() -> Optional[str]:
+    """Build the RDS URL from DATAFORGE_RDS_* env vars once; None if not configured."""
+    host = os.getenv("DATAFORGE_RDS_HOST")
+    port = os.getenv("DATAFORGE_RDS_PORT", "5432")
+    database = os.getenv("DATAFORGE_RDS_DATABASE", "dataforge")
+    username = os.getenv("DATAFORGE_RDS_USERNAME", "postgres")
+    password = os.getenv("DATAFORGE_RDS_PASSWORD")
+    
+    if not all([host, password]):
+        return None
+    
+    return f"postgresql+psycopg://{username}:{password}@{host}:{port}/{database}"
+
+
 class RDSManager:
     """RDS connection management for AWS."""
     
     @staticmethod
     def get_connection_string() -> str:
         """Get RDS connection string from environment."""
-        host = os.getenv("DATAFORGE_RDS_HOST")
-        port = os.getenv("DATAFORGE_RDS_PORT", "5432")
-        database = os.getenv("DATAFORGE_RDS_DATABASE", "dataforge")
-        username = os.getenv("DATAFORGE_RDS_USERNAME", "postgres")
-        password = os.getenv("DATAFORGE_RDS_PASSWORD")
-        
-        if not all([host, password]):
-            return settings.database_url  # Fallback to local config
-        
-        return f"postgresql+psycopg://{username}:{password}@{host}:{port}/{database}"
+        from core.config import settings
+        return _rds_connection_string() or settings.database_url  # Fallback to local config
 
 
 class SecretsManager:
     """AWS Secrets Manager integration."""
     
     def __init__(self):
-        self.secrets_client = boto3.client('secretsmanager')
+        self.secrets_client = _client('secretsmanager')
     
     def get_secret(self, secret_name: str) -> Optional[str]:
-        """Retrieve secret from AWS Secrets Manager."""
+        """Retrieve secret from AWS Secrets Manager, cached per process."""
+        cached = _secret_cache.get(secret_name)
+        if cached and time.monotonic() - cached[0] < SECRET_CACHE_TTL_SECONDS:
+            return cached[1]
+        
         try:
             response = self.secrets_client.get_secret_value(SecretId=secret_name)
-            return response['SecretString']
+            secret = response['SecretString']
+            _secret_cache[secret_name] = (time.monotonic(), secret)
+            return secret
         except ClientError as e:
-            print(f"Failed to retrieve secret {secret_name}: {e}")
+            logger.error("Failed to retrieve secret %s: %s", secret_name, e)
             return None
     
     def get_api_keys(self) -> dict:
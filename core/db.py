@@ -2,18 +2,64 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from core.config import settings
 
 
-engine = create_engine(settings.database_url, pool_pre_ping=True, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
-
 Base = declarative_base()
 
 
+def _pre_ping_enabled() -> bool:
+    if settings.db_pre_ping is not None:
+        return settings.db_pre_ping
+    return settings.environment == "development"
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Return the process-wide engine, creating it on first use."""
+
+    return create_engine(
+        settings.database_url,
+        pool_pre_ping=_pre_ping_enabled(),
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_timeout=settings.db_pool_timeout,
+        future=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def _session_factory() -> sessionmaker:
+    return sessionmaker(bind=get_engine(), autoflush=False, autocommit=False, future=True)
+
+
+def SessionLocal() -> Session:
+    """Open a new session bound to the lazily created engine."""
+
+    return _session_factory()()
+
+
+def _reset_engine_after_fork() -> None:
+    # Pooled connections inherited from the parent must not be reused or closed
+    # by the child; drop them and let the child build its own pool.
+    if get_engine.cache_info().currsize:
+        get_engine().dispose(close=False)
+    get_engine.cache_clear()
+    _session_factory.cache_clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_engine_after_fork)
+
+
 def get_db():
     """FastAPI dependency providing a DB session."""
 
@@ -22,6 +68,3 @@ def get_db():
         yield db
     finally:
         db.close()
-
-
-
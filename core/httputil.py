@@ -0,0 +1,158 @@
+"""HTTP helpers shared by the connectors."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install "dataforge[orjson]"
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def response_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Retry network failures, 429 and 5xx; other errors would fail the same way again."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Delay requested by a Retry-After header (seconds or HTTP date), if any."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def wait_retry_after(
+    fallback: Callable[[RetryCallState], float], max_wait: float = 60.0
+) -> Callable[[RetryCallState], float]:
+    """Tenacity wait that honours Retry-After on 429 responses and otherwise uses ``fallback``."""
+    def wait(retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+            delay = retry_after_seconds(exc.response)
+            if delay is not None:
+                return min(delay, max_wait)
+        return fallback(retry_state)
+    return wait
+
+
+# Retry network errors, 429 and 5xx for a paginated search's page fetch. Jitter
+# keeps concurrent workers from retrying in lockstep; a 429's Retry-After
+# takes precedence
+retry_page = retry(
+    retry=retry_if_exception(is_retryable_error),
+    stop=stop_after_attempt(3),
+    wait=wait_retry_after(wait_exponential_jitter(initial=1, max=30, jitter=2)),
+    reraise=True,
+)
+
+
+async def fetch_offset_pages(
+    fetch_page: Callable[[int, int], Awaitable[Dict[str, Any]]],
+    items_key: str,
+    total_of: Callable[[Dict[str, Any]], Optional[int]],
+    limit: int,
+    page_size: int,
+    max_concurrent_pages: int,
+    start: int = 0,
+) -> List[Dict[str, Any]]:
+    """Fetch up to ``limit`` items from offset ``start`` of an offset/limit paginated search.
+
+    ``fetch_page(offset, count)`` returns one decoded page, whose items are
+    under ``items_key``; ``total_of`` reads the total match count from it,
+    if the API reports one. Once the first page is in, the rest are fetched
+    concurrently.
+    """
+    first = await fetch_page(start, min(page_size, limit))
+    raw = list(first.get(items_key, []))
+    
+    total = total_of(first)
+    end = start + limit
+    if total is not None:
+        end = min(end, total)
+    offset = start + len(raw)
+    exhausted = len(raw) < page_size
+    
+    while not exhausted and offset < end:
+        # With a total every remaining page is known up front;
+        # otherwise prefetch one window of pages at a time.
+        if total is not None:
+            window_end = end
+        else:
+            window_end = min(end, offset + page_size * max_concurrent_pages)
+        
+        offsets = range(offset, window_end, page_size)
+        pages = await asyncio.gather(*(fetch_page(o, min(page_size, end - o)) for o in offsets))
+        
+        for o, page in zip(offsets, pages):
+            items = page.get(items_key, [])
+            raw.extend(items)
+            if len(items) < page_size:
+                logger.info(f"No more results found after offset {o}")
+                exhausted = True
+                break
+        offset = window_end
+    
+    return raw
+
+
+class AsyncRateLimiter:
+    """Token bucket for async callers: ``rate`` requests per second, bursting up to ``burst``.
+
+    Requests go out back-to-back while tokens remain and only wait once the
+    bucket is empty. Create it inside the event loop that uses it.
+    """
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = float(burst or max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    async def __aenter__(self) -> None:
+        await self.acquire()
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import datetime as dt
-
 from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
 
 from core.db import Base
+from core.timeutil import utcnow
 
 
 class BusinessRecord(Base):
@@ -33,7 +32,7 @@ class BusinessRecord(Base):
     business_size = Column(String(32))  # micro, small, medium, large
     is_small_business = Column(Boolean)
     source = Column(String(255), nullable=False)
-    last_verified = Column(DateTime, default=dt.datetime.utcnow)
+    last_verified = Column(DateTime, default=utcnow)
     quality_score = Column(Integer, default=0)
 
 
@@ -56,6 +55,6 @@ class RFPRecord(Base):
     contact_email = Column(String(255))
     estimated_value = Column(String(64))
     source = Column(String(255), nullable=False)
-    last_checked = Column(DateTime, default=dt.datetime.utcnow)
+    last_checked = Column(DateTime, default=utcnow)
 
 
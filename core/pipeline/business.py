@@ -3,40 +3,47 @@
 from __future__ import annotations
 
 import datetime as dt
-from collections import OrderedDict
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable, List
+from typing import Callable, Iterable, Iterator, List
 
 from core.config import settings
 from core.pipeline.dedupe import dedupe_businesses
 from core.pipeline.export import export_business_csv
-from core.pipeline.normalize import normalize_business_record
+from core.pipeline.normalize import build_search_blob, normalize_business_record
 from core.pipeline.qa import run_business_qa
 from core.pipeline.score import score_business_records
 from core.pipeline.ingest import opencorporates, nppes, state_manual
 from core.pipeline.enrich.geocode_census import geocode_records
-from core.pipeline.business_size import classify_by_naics_and_size
+from core.pipeline.business_size import classify_by_naics
 from core.preview import business_preview_store
 from core.schemas import BusinessCanonical, BusinessPullRequest, DataForgeResponse
+from core.textmatch import compile_keywords
+from core.timeutil import utcnow
+
+
+logger = logging.getLogger(__name__)
 
 
 def run_business_pipeline(payload: BusinessPullRequest) -> DataForgeResponse:
     """Execute the business pipeline end-to-end."""
 
     raw_records = _ingest(payload)
-    normalized = [normalize_business_record(item) for item in raw_records]
+    # Normalization and size classification run lazily in one pass
+    prepared: Iterable[BusinessCanonical] = _prepare(raw_records, utcnow())
 
     # Enrichment steps
     enable_geocode = payload.enable_geocoder if payload.enable_geocoder is not None else settings.enable_geocoder_default
     if enable_geocode:
-        normalized = geocode_records(normalized)
-    
-    # Apply business size classification
-    normalized = [classify_by_naics_and_size(record) for record in normalized]
+        # The records were just built by _prepare, so update them without copying
+        prepared = geocode_records(prepared, in_place=True)
 
-    deduped = dedupe_businesses(normalized)
+    deduped = dedupe_businesses(prepared)
     filtered = _apply_filters(deduped, payload)
-    scored = score_business_records(filtered)
+    # The filtered records are the pipeline's own, so score them without copying
+    scored = score_business_records(filtered, in_place=True)
     limited = scored[: payload.limit]
 
     if not limited:
@@ -51,71 +58,89 @@ def run_business_pipeline(payload: BusinessPullRequest) -> DataForgeResponse:
     return DataForgeResponse(ok=qa_report.passed, message=message, export_path=export_path, qa_report=qa_report)
 
 
-def _ingest(payload: BusinessPullRequest) -> List[dict]:
-    records: List[dict] = []
-    
-    # OpenCorporates - Primary business data source
-    try:
-        opencorp_records = opencorporates.fetch_businesses(payload)
-        records.extend(opencorp_records)
-    except Exception as e:
-        print(f"OpenCorporates ingestion failed: {e}")
-    
-    # NPPES - Healthcare organizations
-    try:
-        nppes_records = nppes.ingest_nppes(
-            states=payload.states,
-            keywords=payload.keywords,
-            limit=payload.limit
+def _prepare(raw_records: Iterable[dict], now: dt.datetime) -> Iterator[BusinessCanonical]:
+    """Normalize and size-classify raw records in a single pass, all stamped with ``now``."""
+    for item in raw_records:
+        record = normalize_business_record(item, now)
+        record.business_size, record.is_small_business = classify_by_naics(
+            record.naics_code, record.employee_count, record.annual_revenue_usd
         )
-        records.extend(nppes_records)
-    except Exception as e:
-        print(f"NPPES ingestion failed: {e}")
-    
-    # State Manual - CSV drop functionality
+        yield record
+
+
+def _ingest(payload: BusinessPullRequest) -> Iterator[dict]:
+    # The sources are independent and I/O-bound, so fetch them concurrently.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            # OpenCorporates - Primary business data source
+            executor.submit(_safe, "OpenCorporates", opencorporates.fetch_businesses, payload): "opencorp",
+            # NPPES - Healthcare organizations
+            executor.submit(
+                _safe,
+                "NPPES",
+                nppes.ingest_nppes,
+                states=payload.states,
+                keywords=payload.keywords,
+                limit=payload.limit,
+            ): "nppes",
+            # State Manual - CSV drop functionality
+            executor.submit(
+                _safe,
+                "State manual",
+                state_manual.ingest_state_manual,
+                states=payload.states,
+                keywords=payload.keywords,
+                limit=payload.limit,
+            ): "state",
+        }
+        results = {futures[future]: future.result() for future in as_completed(futures)}
+
+    # Each source arrives sorted; merge them deterministically by company name,
+    # taking ties in source order. The merge is streamed into _prepare rather
+    # than copied into another list.
+    return heapq.merge(*(results[source] for source in futures.values()), key=_company_name)
+
+
+def _company_name(record: dict) -> str:
+    return record.get("company_name") or ""
+
+
+def _safe(name: str, fn: Callable[..., List[dict]], *args, **kwargs) -> List[dict]:
+    """Run a source fetcher and sort its records by company name; none if it fails."""
     try:
-        state_records = state_manual.ingest_state_manual(
-            states=payload.states,
-            keywords=payload.keywords,
-            limit=payload.limit
-        )
-        records.extend(state_records)
+        records = fn(*args, **kwargs)
     except Exception as e:
-        print(f"State manual ingestion failed: {e}")
-    
-    # Sort deterministically by company name
-    records.sort(key=lambda r: (r.get("company_name") or ""))
+        logger.exception("%s ingestion failed: %s", name, e)
+        return []
+    records.sort(key=_company_name)
     return records
 
 
 def _apply_filters(records: Iterable[BusinessCanonical], payload: BusinessPullRequest) -> List[BusinessCanonical]:
-    keywords = set((payload.keywords or []) + (payload.naics or []))
-    lower_keywords = {k.lower() for k in keywords if k}
+    # One automaton scans each haystack once instead of once per keyword
+    keyword_match = compile_keywords((payload.keywords or []) + (payload.naics or []))
+    naics_codes = frozenset(payload.naics) if payload.naics else None
 
     min_years = payload.min_years
     max_years = payload.max_years
 
+    if (
+        not naics_codes
+        and keyword_match is None
+        and min_years is None
+        and max_years is None
+        and payload.small_business_only is not True
+        and not payload.business_size
+    ):
+        # Nothing to filter on: hand a list back untouched rather than copying it
+        return records if isinstance(records, list) else list(records)
+
+    # Cheap field comparisons run first so the keyword scan only sees their survivors
     filtered: List[BusinessCanonical] = []
     for record in records:
         # NAICS filter
-        if payload.naics and record.naics_code and record.naics_code not in payload.naics:
+        if naics_codes and record.naics_code and record.naics_code not in naics_codes:
             continue
-        
-        # Keywords filter
-        if lower_keywords:
-            haystack = " ".join(
-                filter(
-                    None,
-                    (
-                        record.company_name,
-                        record.industry or "",
-                        record.domain or "",
-                        record.naics_code or "",
-                    ),
-                )
-            ).lower()
-            if not any(keyword in haystack for keyword in lower_keywords):
-                continue
 
         # Years in business filter
         years = record.years_in_business
@@ -132,7 +157,12 @@ def _apply_filters(records: Iterable[BusinessCanonical], payload: BusinessPullRe
         if payload.business_size and record.business_size != payload.business_size:
             continue
 
+        # Keywords filter
+        if keyword_match:
+            haystack = record._search_blob or build_search_blob(record)
+            if not keyword_match(haystack):
+                continue
+
         filtered.append(record)
 
     return filtered
-
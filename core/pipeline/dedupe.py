@@ -2,48 +2,55 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from core.schemas import BusinessCanonical
 
 
+_FIELDS = tuple(BusinessCanonical.model_fields)
+
+
 def dedupe_businesses(records: Iterable[BusinessCanonical]) -> List[BusinessCanonical]:
-    by_domain: Dict[str, BusinessCanonical] = {}
-    by_phone: Dict[str, BusinessCanonical] = {}
     unique: List[BusinessCanonical] = []
+    # Indexes into ``unique`` so merges are visible through every lookup path
+    by_domain: Dict[str, int] = {}
+    by_phone: Dict[str, int] = {}
+    # Fuzzy-match candidates blocked by postal code: (indexes, company names)
+    by_postal: Dict[str, Tuple[List[int], List[str]]] = {}
 
     for record in records:
         key = _canonical_key(record)
-        if key and key in by_domain:
-            merged = _merge_records(by_domain[key], record)
-            by_domain[key] = merged
-            continue
-
-        if record.phone and record.phone in by_phone:
-            merged = _merge_records(by_phone[record.phone], record)
-            by_phone[record.phone] = merged
-            continue
+        match_idx: Optional[int] = None
 
-        # Fuzzy matching with name and postal_code
-        matched = False
-        for existing in unique:
-            if record.postal_code and existing.postal_code and record.postal_code == existing.postal_code:
-                score = fuzz.token_sort_ratio(record.company_name, existing.company_name)
-                if score >= 90:
-                    merged = _merge_records(existing, record)
-                    unique[unique.index(existing)] = merged
-                    matched = True
-                    break
-        if matched:
+        if key and key in by_domain:
+            match_idx = by_domain[key]
+        elif record.phone and record.phone in by_phone:
+            match_idx = by_phone[record.phone]
+        elif record.postal_code and record.postal_code in by_postal:
+            # Fuzzy matching with name within the same postal code
+            indexes, names = by_postal[record.postal_code]
+            best = process.extractOne(
+                record.company_name, names, scorer=fuzz.token_sort_ratio, score_cutoff=90
+            )
+            if best is not None:
+                match_idx = indexes[best[2]]
+
+        if match_idx is not None:
+            unique[match_idx] = _merge_records(unique[match_idx], record)
             continue
 
+        idx = len(unique)
         unique.append(record)
         if key:
-            by_domain[key] = record
+            by_domain[key] = idx
         if record.phone:
-            by_phone[record.phone] = record
+            by_phone[record.phone] = idx
+        if record.postal_code:
+            indexes, names = by_postal.setdefault(record.postal_code, ([], []))
+            indexes.append(idx)
+            names.append(record.company_name)
 
     return unique
 
@@ -55,18 +62,19 @@ def _canonical_key(record: BusinessCanonical) -> Optional[str]:
 
 
 def _merge_records(primary: BusinessCanonical, incoming: BusinessCanonical) -> BusinessCanonical:
-    data = primary.model_dump()
-    for field, value in incoming.model_dump().items():
+    data = {}
+    for field in _FIELDS:
+        current = getattr(primary, field)
+        value = getattr(incoming, field)
         if not value:
-            continue
-        current = data.get(field)
-        if not current:
+            data[field] = current
+        elif not current:
             data[field] = value
         elif field == "source" and value not in current:
             data[field] = ";".join(sorted(set(current.split(";") + [value])))
-        elif field == "last_verified":
-            if value > current:
-                data[field] = value
-    return BusinessCanonical(**data)
-
-
+        elif field == "last_verified" and value > current:
+            data[field] = value
+        else:
+            data[field] = current
+    # Both inputs are already validated, so skip re-validation
+    return BusinessCanonical.model_construct(**data)
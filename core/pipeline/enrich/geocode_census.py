@@ -2,29 +2,142 @@
 U.S. Census Geocoder - County & FIPS lookup.
 
 Endpoints:
-- One-line: https://geocoding.geo.census.gov/geocoder/locations/onelineaddress
-- Component: https://geocoding.geo.census.gov/geocoder/locations/address
+- Batch: https://geocoding.geo.census.gov/geocoder/geographies/addressbatch
+- One-line: https://geocoding.geo.census.gov/geocoder/geographies/onelineaddress
+- Component: https://geocoding.geo.census.gov/geocoder/geographies/address
 
 Output: county name + 5-digit county FIPS
 """
 
 from __future__ import annotations
 
+import asyncio
+import csv
+import hashlib
+import io
 import logging
+import sqlite3
 import time
-from typing import Iterable, List, Optional, Dict, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Dict, Any, Sequence, Tuple
 from urllib.parse import quote
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
+from core.config import settings
+from core.httputil import is_retryable_error, response_json
 from core.schemas import BusinessCanonical
 
 logger = logging.getLogger(__name__)
 
 # Census Geocoder endpoints
-ONELINE_URL = "https://geocoding.geo.census.gov/geocoder/locations/onelineaddress"
-COMPONENT_URL = "https://geocoding.geo.census.gov/geocoder/locations/address"
+ONELINE_URL = "https://geocoding.geo.census.gov/geocoder/geographies/onelineaddress"
+COMPONENT_URL = "https://geocoding.geo.census.gov/geocoder/geographies/address"
+BATCH_URL = "https://geocoding.geo.census.gov/geocoder/geographies/addressbatch"
+BATCH_SIZE = 1000  # API accepts up to 10,000; smaller batches return sooner and retry cheaper
+SINGLE_LOOKUP_CONCURRENCY = 16  # In-flight single-address requests in the fallback path
+
+# (address_line1, city, state, postal_code)
+AddressKey = Tuple[str, str, str, str]
+# (county, county_fips); either may be None
+CachedResult = Tuple[Optional[str], Optional[str]]
+
+
+def _read_crosswalk_rows(path: Path) -> Iterable[Tuple[str, str, str]]:
+    """Valid ``(zip5, county_fips, county_name)`` rows of a ZIP-county crosswalk CSV."""
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+            zip5 = row.get("zip", "")[:5]
+            county_fips = row.get("county_fips") or row.get("county", "")
+            if len(zip5) != 5 or len(county_fips) != 5 or not county_fips.isdigit():
+                continue
+            yield zip5, county_fips, row.get("county_name", "")
+
+
+@lru_cache(maxsize=4)
+def load_zip_crosswalk(path: Path) -> Dict[str, CachedResult]:
+    """
+    Load a ZIP -> county crosswalk CSV (e.g. the HUD USPS ZIP-County file).
+    
+    Expects a ZIP column (``zip``) and a 5-digit county FIPS column (``county``
+    or ``county_fips``), plus an optional ``county_name``. ZIPs that span more
+    than one county are left out so those addresses still go to the Census.
+    """
+    counties: Dict[str, set] = {}
+    for zip5, county_fips, _ in _read_crosswalk_rows(path):
+        counties.setdefault(zip5, set()).add(county_fips)
+    names = load_county_names(path)
+    
+    crosswalk: Dict[str, CachedResult] = {}
+    for zip5, fips_codes in counties.items():
+        if len(fips_codes) == 1:
+            county_fips = next(iter(fips_codes))
+            crosswalk[zip5] = (names.get(county_fips), county_fips)
+    logger.info(f"Loaded ZIP-county crosswalk: {len(crosswalk)} unambiguous ZIPs from {path}")
+    return crosswalk
+
+
+@lru_cache(maxsize=4)
+def load_county_names(path: Path) -> Dict[str, str]:
+    """County FIPS -> county name from the crosswalk's ``county_name`` column, if it has one."""
+    return {county_fips: name for _, county_fips, name in _read_crosswalk_rows(path) if name}
+
+
+class GeocodeCache:
+    """SQLite-backed store of county/FIPS results keyed by normalized address."""
+    
+    def __init__(self, directory: Path, ttl_seconds: int):
+        directory.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(directory / "census.sqlite3"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            "key TEXT PRIMARY KEY, county TEXT, county_fips TEXT, stored_at REAL NOT NULL)"
+        )
+        self._ttl_seconds = ttl_seconds
+    
+    @staticmethod
+    def make_key(address: AddressKey) -> str:
+        normalized = " ".join(", ".join(address).lower().split())
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def get_many(self, keys: Sequence[str]) -> Dict[str, CachedResult]:
+        cutoff = time.time() - self._ttl_seconds
+        found: Dict[str, CachedResult] = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT key, county, county_fips FROM geocode "
+                f"WHERE stored_at >= ? AND key IN ({','.join('?' * len(chunk))})",
+                (cutoff, *chunk),
+            )
+            for key, county, county_fips in rows:
+                found[key] = (county, county_fips)
+        return found
+    
+    def set_many(self, results: Dict[str, CachedResult]) -> None:
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO geocode (key, county, county_fips, stored_at) VALUES (?, ?, ?, ?)",
+                [(key, county, county_fips, now) for key, (county, county_fips) in results.items()],
+            )
+    
+    def county_names(self, fips_codes: Sequence[str]) -> Dict[str, str]:
+        """Names stored for any of ``fips_codes`` by earlier single-address lookups."""
+        names: Dict[str, str] = {}
+        for start in range(0, len(fips_codes), 500):
+            chunk = fips_codes[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT county_fips, county FROM geocode "
+                f"WHERE county IS NOT NULL AND county_fips IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            names.update(rows)
+        return names
 
 
 class CensusGeocoder:
@@ -32,43 +145,145 @@ class CensusGeocoder:
     
     def __init__(self):
         self.enabled = True  # Always available (no API key required)
+        self._cache: Optional[GeocodeCache] = None
+        self._cache_failed = False
+        self._client: Optional[httpx.Client] = None
     
-    def _build_oneline_address(self, record: BusinessCanonical) -> str:
-        """Build a single-line address string for geocoding."""
-        parts = []
+    @property
+    def client(self) -> httpx.Client:
+        """Keep-alive HTTP/2 client shared by all synchronous Census requests."""
+        if self._client is None:
+            self._client = httpx.Client(
+                http2=True,
+                timeout=10,
+                headers={"User-Agent": "DataForge/1.0"},
+                limits=httpx.Limits(max_keepalive_connections=16),
+            )
+        return self._client
+    
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
+    def _get_cache(self) -> Optional[GeocodeCache]:
+        """Open the on-disk cache on first use; None when disabled or unavailable."""
+        if not settings.census_cache_enabled or self._cache_failed:
+            return None
+        if self._cache is None:
+            try:
+                self._cache = GeocodeCache(
+                    settings.census_cache_dir, settings.census_cache_ttl_days * 86400
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Census geocoder cache unavailable, continuing without it: {e}")
+                self._cache_failed = True
+        return self._cache
+    
+    @staticmethod
+    def _zip_crosswalk() -> Optional[Dict[str, CachedResult]]:
+        """The configured ZIP -> county crosswalk, or None if not set up."""
+        path = settings.zip_county_crosswalk_path
+        if not path:
+            return None
+        try:
+            return load_zip_crosswalk(path)
+        except OSError as e:
+            logger.warning(f"ZIP-county crosswalk unavailable: {e}")
+            return None
+    
+    def _county_names(
+        self, representatives: Dict[str, BusinessCanonical], cache: Optional[GeocodeCache]
+    ) -> Dict[str, str]:
+        """
+        Names for the county FIPS codes in ``representatives``.
         
-        if record.address_line1:
-            parts.append(record.address_line1)
-        if record.city:
-            parts.append(record.city)
-        if record.state:
-            parts.append(record.state)
-        if record.postal_code:
-            parts.append(record.postal_code)
+        The batch endpoint returns only FIPS codes. Names come from the
+        crosswalk, then earlier cached lookups, and any still missing from one
+        single-address lookup per county using its representative record.
+        """
+        names: Dict[str, str] = {}
+        path = settings.zip_county_crosswalk_path
+        if path:
+            try:
+                names.update(load_county_names(path))
+            except OSError as e:
+                logger.warning(f"ZIP-county crosswalk unavailable: {e}")
+        
+        missing = [fips for fips in representatives if fips not in names]
+        if cache and missing:
+            try:
+                names.update(cache.county_names(missing))
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to read Census geocoder cache: {e}")
+            missing = [fips for fips in missing if fips not in names]
         
-        return ", ".join(parts)
+        if missing:
+            records = [representatives[fips] for fips in missing]
+            for fips, geocoded in zip(missing, self._geocode_individually(records)):
+                if geocoded.county and geocoded.county_fips == fips:
+                    names[fips] = geocoded.county
+        
+        return {fips: names[fips] for fips in representatives if fips in names}
+    
+    @staticmethod
+    def _zip_update(
+        crosswalk: Optional[Dict[str, CachedResult]], record: BusinessCanonical
+    ) -> Optional[Dict[str, str]]:
+        """County fields for the record's ZIP, if the crosswalk maps it to one county."""
+        if not crosswalk or not record.postal_code:
+            return None
+        hit = crosswalk.get(record.postal_code[:5])
+        if not hit:
+            return None
+        county, county_fips = hit
+        return {"county": county, "county_fips": county_fips} if county else {"county_fips": county_fips}
+    
+    def _build_oneline_address(self, record: BusinessCanonical) -> str:
+        """Build a single-line address string for geocoding."""
+        return ", ".join(filter(None, (record.address_line1, record.city, record.state, record.postal_code)))
+    
+    @staticmethod
+    def _oneline_params(address: str) -> Dict[str, str]:
+        return {
+            "address": address,
+            "benchmark": "Public_AR_Current",
+            "vintage": "Current_Current",
+            "layers": "Counties",
+            "format": "json"
+        }
     
+    @staticmethod
+    def _component_params(record: BusinessCanonical) -> Dict[str, str]:
+        return {
+            "street": record.address_line1 or "",
+            "city": record.city or "",
+            "state": record.state or "",
+            "zip": record.postal_code or "",
+            "benchmark": "Public_AR_Current",
+            "vintage": "Current_Current",
+            "layers": "Counties",
+            "format": "json"
+        }
+    
+    # 4xx (e.g. an unparseable address) fails fast; only network errors,
+    # 429 and 5xx are retried, with short backoff.
     @retry(
+        retry=retry_if_exception(is_retryable_error),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=8)
+        wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
+        reraise=True,
     )
+    def _fetch_match(self, url: str, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        response = self.client.get(url, params=params)
+        response.raise_for_status()
+        matches = response_json(response).get("result", {}).get("addressMatches", [])
+        return matches[0] if matches else None
+    
     def _geocode_oneline(self, address: str) -> Optional[Dict[str, Any]]:
         """Geocode using the one-line address endpoint."""
         try:
-            params = {
-                "address": address,
-                "benchmark": "Public_AR_Current",
-                "format": "json"
-            }
-            
-            response = httpx.get(ONELINE_URL, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            matches = data.get("result", {}).get("addressMatches", [])
-            if matches:
-                return matches[0]
-            
+            return self._fetch_match(ONELINE_URL, self._oneline_params(address))
         except httpx.HTTPError as e:
             logger.warning(f"Census geocoder one-line request failed: {e}")
         except Exception as e:
@@ -76,30 +291,10 @@ class CensusGeocoder:
         
         return None
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=8)
-    )
     def _geocode_component(self, record: BusinessCanonical) -> Optional[Dict[str, Any]]:
         """Geocode using the component address endpoint."""
         try:
-            params = {
-                "street": record.address_line1 or "",
-                "city": record.city or "",
-                "state": record.state or "",
-                "zip": record.postal_code or "",
-                "benchmark": "Public_AR_Current",
-                "format": "json"
-            }
-            
-            response = httpx.get(COMPONENT_URL, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            matches = data.get("result", {}).get("addressMatches", [])
-            if matches:
-                return matches[0]
-            
+            return self._fetch_match(COMPONENT_URL, self._component_params(record))
         except httpx.HTTPError as e:
             logger.warning(f"Census geocoder component request failed: {e}")
         except Exception as e:
@@ -116,6 +311,10 @@ class CensusGeocoder:
         if not record.address_line1 and not record.postal_code:
             return record
         
+        zip_update = self._zip_update(self._zip_crosswalk(), record)
+        if zip_update:
+            return record.model_copy(update=zip_update)
+        
         # Try one-line address first (more reliable)
         if record.address_line1 and record.city and record.state:
             address = self._build_oneline_address(record)
@@ -128,21 +327,22 @@ class CensusGeocoder:
             logger.debug(f"No geocoding match found for: {record.company_name}")
             return record
         
+        return self._apply_match(record, match)
+    
+    def _apply_match(self, record: BusinessCanonical, match: Dict[str, Any]) -> BusinessCanonical:
+        """Copy county and FIPS from a single-address match onto the record."""
         # Extract county and FIPS from the match
         county = None
         county_fips = None
         
         try:
-            # Get county name from address components
-            components = match.get("addressComponents", {})
-            county = components.get("county", "").strip()
-            
-            # Get county FIPS from geographies
+            # County name and GEOID (state + county FIPS) from the Counties layer
             geographies = match.get("geographies", {})
             counties = geographies.get("Counties", [])
             
             if counties:
-                county_fips = counties[0].get("COUNTY", "").strip()
+                county = (counties[0].get("NAME") or "").strip() or None
+                county_fips = (counties[0].get("GEOID") or "").strip()
                 
                 # Ensure FIPS is 5 digits
                 if county_fips and len(county_fips) == 5 and county_fips.isdigit():
@@ -163,33 +363,238 @@ class CensusGeocoder:
             "county_fips": county_fips,
         })
     
-    def geocode_records(self, records: Iterable[BusinessCanonical]) -> List[BusinessCanonical]:
-        """Geocode multiple business records."""
+    @retry(
+        retry=retry_if_exception(is_retryable_error),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
+        reraise=True,
+    )
+    def _geocode_batch(self, records: Sequence[BusinessCanonical]) -> Dict[int, str]:
+        """
+        Geocode up to BATCH_SIZE records in one request to the batch endpoint.
+        
+        Returns a mapping of position in ``records`` to 5-digit county FIPS
+        for every address the Census matched.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for idx, record in enumerate(records):
+            writer.writerow([
+                idx,
+                record.address_line1 or "",
+                record.city or "",
+                record.state or "",
+                record.postal_code or "",
+            ])
+        
+        response = self.client.post(
+            BATCH_URL,
+            data={"benchmark": "Public_AR_Current", "vintage": "Current_Current"},
+            files={"addressFile": ("addresses.csv", buffer.getvalue(), "text/csv")},
+            timeout=300,
+        )
+        response.raise_for_status()
+        
+        # Rows: id, input address, match status, match type, matched address,
+        # "lon,lat", TIGER line id, side, state FIPS, county FIPS, tract, block
+        matches: Dict[int, str] = {}
+        for row in csv.reader(io.StringIO(response.text)):
+            if len(row) < 10 or row[2] != "Match":
+                continue
+            county_fips = row[8] + row[9]
+            if len(county_fips) == 5 and county_fips.isdigit():
+                matches[int(row[0])] = county_fips
+        return matches
+    
+    @retry(
+        retry=retry_if_exception(is_retryable_error),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
+        reraise=True,
+    )
+    async def _fetch_match_async(
+        self, client: httpx.AsyncClient, url: str, params: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        matches = response_json(response).get("result", {}).get("addressMatches", [])
+        return matches[0] if matches else None
+    
+    async def _geocode_record_async(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, record: BusinessCanonical
+    ) -> BusinessCanonical:
+        """Async counterpart of geocode_record sharing one client."""
+        if not record.address_line1 and not record.postal_code:
+            return record
+        
+        if record.address_line1 and record.city and record.state:
+            url, params = ONELINE_URL, self._oneline_params(self._build_oneline_address(record))
+        else:
+            url, params = COMPONENT_URL, self._component_params(record)
+        
+        try:
+            # The semaphore bounds in-flight requests; it replaces the old fixed sleep
+            async with semaphore:
+                match = await self._fetch_match_async(client, url, params)
+        except Exception as e:
+            logger.warning(f"Census geocoder request failed for {record.company_name}: {e}")
+            return record
+        
+        if not match:
+            logger.debug(f"No geocoding match found for: {record.company_name}")
+            return record
+        
+        return self._apply_match(record, match)
+    
+    async def geocode_records_async(
+        self, records: Sequence[BusinessCanonical], concurrency: int = SINGLE_LOOKUP_CONCURRENCY
+    ) -> List[BusinessCanonical]:
+        """Geocode records one address per request, with bounded concurrency."""
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(
+            http2=True, limits=limits, timeout=10, headers={"User-Agent": "DataForge/1.0"}
+        ) as client:
+            results = await asyncio.gather(
+                *(self._geocode_record_async(client, semaphore, record) for record in records),
+                return_exceptions=True,
+            )
+        
+        # Keep the original record if anything unexpected escaped
+        return [
+            record if isinstance(result, BaseException) else result
+            for record, result in zip(records, results)
+        ]
+    
+    def _geocode_individually(self, records: Sequence[BusinessCanonical]) -> List[BusinessCanonical]:
+        """Fallback: geocode records one address per request."""
+        return asyncio.run(self.geocode_records_async(records))
+    
+    @staticmethod
+    def _address_key(record: BusinessCanonical) -> AddressKey:
+        return (
+            record.address_line1 or "",
+            record.city or "",
+            record.state or "",
+            record.postal_code or "",
+        )
+    
+    @staticmethod
+    def _updated(record: BusinessCanonical, update: Dict[str, Any], in_place: bool) -> BusinessCanonical:
+        if not in_place:
+            return record.model_copy(update=update)
+        for field, value in update.items():
+            setattr(record, field, value)
+        return record
+    
+    def geocode_records(
+        self, records: Iterable[BusinessCanonical], in_place: bool = False
+    ) -> List[BusinessCanonical]:
+        """
+        Geocode multiple business records via the batch endpoint.
+        
+        With ``in_place=True`` the input records are updated directly instead
+        of being copied; use it when the caller owns the records.
+        """
         if not self.enabled:
             return list(records)
         
-        enriched = []
-        for record in records:
+        enriched = list(records)
+        crosswalk = self._zip_crosswalk()
+        
+        # Partition up front: records without a street address or ZIP are
+        # left alone, unambiguous ZIPs resolve locally, and records sharing an
+        # address (branch offices, cross-source duplicates) are looked up once
+        # and the result fanned back out. The batch endpoint needs a street
+        # address; others cannot be matched.
+        positions_by_key: Dict[AddressKey, List[int]] = {}
+        for idx, record in enumerate(enriched):
+            if not record.address_line1 and not record.postal_code:
+                continue
+            zip_update = self._zip_update(crosswalk, record)
+            if zip_update:
+                enriched[idx] = self._updated(record, zip_update, in_place)
+            elif record.address_line1:
+                positions_by_key.setdefault(self._address_key(record), []).append(idx)
+        
+        if not positions_by_key:
+            return enriched
+        
+        logger.info(
+            f"Geocoding {len(positions_by_key)} distinct addresses for {len(enriched)} records"
+        )
+        
+        updates: Dict[AddressKey, Dict[str, Any]] = {}
+        fresh: Dict[AddressKey, CachedResult] = {}
+        
+        cache = self._get_cache()
+        cache_keys: Dict[AddressKey, str] = {}
+        if cache:
+            cache_keys = {key: cache.make_key(key) for key in positions_by_key}
+            hits = cache.get_many(list(cache_keys.values()))
+            for key, cache_key in cache_keys.items():
+                if cache_key in hits:
+                    county, county_fips = hits[cache_key]
+                    updates[key] = {
+                        field: value
+                        for field, value in (("county", county), ("county_fips", county_fips))
+                        if value
+                    }
+        
+        keys = [key for key in positions_by_key if key not in updates]
+        
+        for start in range(0, len(keys), BATCH_SIZE):
+            chunk_keys = keys[start:start + BATCH_SIZE]
+            chunk = [enriched[positions_by_key[key][0]] for key in chunk_keys]
+            
             try:
-                geocoded = self.geocode_record(record)
-                enriched.append(geocoded)
-                
-                # Rate limiting to be respectful to the API
-                time.sleep(0.1)
-                
+                matches = self._geocode_batch(chunk)
             except Exception as e:
-                logger.error(f"Error geocoding record {record.company_name}: {e}")
-                enriched.append(record)  # Keep original record on error
+                logger.warning(f"Census batch geocoding failed, falling back to single lookups: {e}")
+                for key, original, geocoded in zip(chunk_keys, chunk, self._geocode_individually(chunk)):
+                    if geocoded is not original:
+                        updates[key] = {"county": geocoded.county, "county_fips": geocoded.county_fips}
+                        fresh[key] = (geocoded.county, geocoded.county_fips)
+                continue
+            
+            for offset, key in enumerate(chunk_keys):
+                county_fips = matches.get(offset)
+                # A completed batch is authoritative, so unmatched addresses are cached too
+                fresh[key] = (None, county_fips)
+                if county_fips:
+                    updates[key] = {"county_fips": county_fips}
+        
+        # Batch matches (and rows cached from them) carry only the FIPS code
+        unnamed = [key for key, update in updates.items() if "county" not in update and "county_fips" in update]
+        if unnamed:
+            representatives: Dict[str, BusinessCanonical] = {}
+            for key in unnamed:
+                representatives.setdefault(updates[key]["county_fips"], enriched[positions_by_key[key][0]])
+            names = self._county_names(representatives, cache)
+            for key in unnamed:
+                county_fips = updates[key]["county_fips"]
+                if county_fips in names:
+                    updates[key] = {"county": names[county_fips], "county_fips": county_fips}
+                    fresh[key] = (names[county_fips], county_fips)
+        
+        if cache and fresh:
+            try:
+                cache.set_many({cache_keys[key]: result for key, result in fresh.items()})
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write Census geocoder cache: {e}")
+        
+        for key, update in updates.items():
+            for idx in positions_by_key[key]:
+                enriched[idx] = self._updated(enriched[idx], update, in_place)
         
         return enriched
 
-
 # Global instance
 census_geocoder = CensusGeocoder()
 
 
-def geocode_records(records: Iterable[BusinessCanonical]) -> List[BusinessCanonical]:
+def geocode_records(records: Iterable[BusinessCanonical], in_place: bool = False) -> List[BusinessCanonical]:
     """Legacy function for backward compatibility."""
-    return census_geocoder.geocode_records(records)
+    return census_geocoder.geocode_records(records, in_place=in_place)
 
 
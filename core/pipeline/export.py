@@ -3,13 +3,40 @@
 from __future__ import annotations
 
 import csv
-import datetime as dt
+import gzip
+import hashlib
+import io
+import logging
+import shutil
+import tempfile
+from contextlib import ExitStack
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Sequence, TextIO, Union
 
 from core.config import settings
 from core.schemas import BusinessCanonical, BusinessPullRequest, RFPCanonical, RFPPullRequest
 from core.aws import S3Exporter
+from core.timeutil import utcnow
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional: pip install "dataforge[arrow]"
+    pa = None
+    pq = None
+
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_ROWS = 10_000
+# Exports bound for S3 stay in memory up to this size before spilling to a temp file
+SPOOL_MAX_BYTES = 64 * 1024 * 1024
+GZIP_COMPRESSLEVEL = 6
+# Filename slugs spell out this many states / filters; longer lists end in a digest
+SLUG_MAX_PARTS = 3
+# zstd packs the Parquet companions tighter than pyarrow's snappy default
+PARQUET_COMPRESSION = "zstd"
 
 
 BUSINESS_HEADER = [
@@ -37,6 +64,17 @@ BUSINESS_HEADER = [
     "quality_score",
 ]
 
+# Arrow types for the Parquet companion files; columns not listed are strings
+BUSINESS_ARROW_TYPES: Dict[str, str] = {
+    "founded_year": "int32",
+    "years_in_business": "int32",
+    "employee_count": "int64",
+    "annual_revenue_usd": "int64",
+    "is_small_business": "bool",
+    "last_verified": "timestamp[us]",
+    "quality_score": "int32",
+}
+
 RFP_HEADER = [
     "notice_id",
     "title",
@@ -57,99 +95,244 @@ RFP_HEADER = [
 ]
 
 
+RFP_ARROW_TYPES: Dict[str, str] = {
+    "posted_date": "date32",
+    "close_date": "date32",
+    "last_checked": "timestamp[us]",
+}
+
+
+def _business_row(record: BusinessCanonical) -> tuple:
+    """CSV row for a business record, in BUSINESS_HEADER order."""
+    # Read the model's field storage directly; this is a read-only hot loop
+    d = record.__dict__
+    return (
+        d["company_name"],
+        d["domain"] or "",
+        d["phone"] or "",
+        d["email"] or "",
+        d["address_line1"] or "",
+        d["city"] or "",
+        d["state"],
+        d["postal_code"] or "",
+        d["country"],
+        d["county"] or "",
+        d["county_fips"] or "",
+        d["naics_code"] or "",
+        d["industry"] or "",
+        d["founded_year"] or "",
+        d["years_in_business"] or "",
+        d["employee_count"] or "",
+        d["annual_revenue_usd"] or "",
+        d["business_size"] or "",
+        d["is_small_business"] or "",
+        d["source"],
+        d["last_verified"].isoformat(),
+        d["quality_score"],
+    )
+
+
+def _rfp_row(record: RFPCanonical) -> tuple:
+    """CSV row for an RFP record, in RFP_HEADER order."""
+    d = record.__dict__
+    return (
+        d["notice_id"],
+        d["title"],
+        d["agency"] or "",
+        d["naics"] or "",
+        d["solicitation_number"] or "",
+        d["notice_type"] or "",
+        d["posted_date"].isoformat() if d["posted_date"] else "",
+        d["close_date"].isoformat() if d["close_date"] else "",
+        d["place_of_performance_state"] or "",
+        d["description"] or "",
+        d["url"] or "",
+        d["contact_name"] or "",
+        d["contact_email"] or "",
+        d["estimated_value"] or "",
+        d["source"],
+        d["last_checked"].isoformat(),
+    )
+
+
+class _Echo:
+    """File-like sink whose write hands the formatted CSV line straight back."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _iter_csv(header: Sequence[str], row_fn: Callable[..., tuple], records: Iterable) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    writerow = writer.writerow
+    for record in records:
+        yield writerow(row_fn(record))
+
+
+def iter_business_csv(records: Iterable[BusinessCanonical]) -> Iterator[str]:
+    """Business export CSV one line at a time, holding only the current row.
+
+    Suitable as the body of a streaming HTTP response.
+    """
+    return _iter_csv(BUSINESS_HEADER, _business_row, records)
+
+
+def iter_rfp_csv(records: Iterable[RFPCanonical]) -> Iterator[str]:
+    """RFP export CSV one line at a time, holding only the current row."""
+    return _iter_csv(RFP_HEADER, _rfp_row, records)
+
+
 def ensure_export_dir() -> Path:
     export_dir = settings.export_bucket_path
     export_dir.mkdir(parents=True, exist_ok=True)
     return export_dir
 
 
-def export_business_csv(records: Iterable[BusinessCanonical], payload: BusinessPullRequest) -> str:
-    export_dir = ensure_export_dir()
-    states_slug = "-".join(sorted(payload.states))
-    filter_slug = "-".join((payload.naics or payload.keywords or ["all"]))
-    date_prefix = dt.datetime.utcnow().strftime("%Y%m%d")
-    filename = f"business-{date_prefix}-{states_slug}-{filter_slug}.csv"
-    path = export_dir / filename
+def _parquet_enabled() -> bool:
+    if not settings.export_parquet:
+        return False
+    if pa is None:
+        logger.warning("DATAFORGE_EXPORT_PARQUET is set but pyarrow is not installed; writing CSV only")
+        return False
+    return True
 
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(BUSINESS_HEADER)
-        for record in records:
-            writer.writerow(
-                [
-                    record.company_name,
-                    record.domain or "",
-                    record.phone or "",
-                    record.email or "",
-                    record.address_line1 or "",
-                    record.city or "",
-                    record.state,
-                    record.postal_code or "",
-                    record.country,
-                    record.county or "",
-                    record.county_fips or "",
-                    record.naics_code or "",
-                    record.industry or "",
-                    record.founded_year or "",
-                    record.years_in_business or "",
-                    record.employee_count or "",
-                    record.annual_revenue_usd or "",
-                    record.business_size or "",
-                    record.is_small_business or "",
-                    record.source,
-                    record.last_verified.isoformat(),
-                    record.quality_score,
-                ]
-            )
+
+def _write_rows(
+    csv_file: TextIO,
+    parquet_sink: Optional[Union[Path, BinaryIO]],
+    header: Sequence[str],
+    row_fn: Callable[..., tuple],
+    records: Iterable,
+    arrow_types: Dict[str, str],
+) -> None:
+    """Write records to an open CSV file and, if given, a Parquet sink in one pass."""
+    parquet_writer = None
+    schema = None
+    if parquet_sink is not None:
+        schema = pa.schema([(name, pa.type_for_alias(arrow_types.get(name, "string"))) for name in header])
+        parquet_writer = pq.ParquetWriter(parquet_sink, schema, compression=PARQUET_COMPRESSION)
+    
+    try:
+        writer = csv.writer(csv_file)
+        writer.writerow(header)
+        iterator = iter(records)
+        # Batches bound memory for the Parquet row groups; CSV rows stream through
+        while batch := list(islice(iterator, EXPORT_BATCH_ROWS)):
+            writer.writerows(map(row_fn, batch))
+            if parquet_writer:
+                columns = {name: [record.__dict__[name] for record in batch] for name in header}
+                parquet_writer.write_table(pa.table(columns, schema=schema))
+    finally:
+        if parquet_writer:
+            parquet_writer.close()
+
+
+def _write_export(
+    filename: str,
+    header: Sequence[str],
+    row_fn: Callable[..., tuple],
+    records: Iterable,
+    arrow_types: Dict[str, str],
+) -> str:
+    """Write an export locally, or straight to S3 when a bucket is configured."""
+    parquet_name = str(Path(filename).with_suffix(".parquet"))
+    with_parquet = _parquet_enabled()
+    if settings.export_gzip:
+        filename += ".gz"
     
-    # Upload to S3 if configured
     if settings.s3_bucket:
-        s3_exporter = S3Exporter(settings.s3_bucket)
-        s3_key = f"exports/{filename}"
-        return s3_exporter.upload_file(path, s3_key)
+        return _stream_to_s3(filename, parquet_name, with_parquet, header, row_fn, records, arrow_types)
     
+    export_dir = ensure_export_dir()
+    path = export_dir / filename
+    if settings.export_gzip:
+        opened = gzip.open(path, "wt", newline="", encoding="utf-8", compresslevel=GZIP_COMPRESSLEVEL)
+    else:
+        opened = path.open("w", newline="", encoding="utf-8")
+    with opened as f:
+        _write_rows(f, export_dir / parquet_name if with_parquet else None, header, row_fn, records, arrow_types)
     return str(path)
 
 
+def _stream_to_s3(
+    filename: str,
+    parquet_name: str,
+    with_parquet: bool,
+    header: Sequence[str],
+    row_fn: Callable[..., tuple],
+    records: Iterable,
+    arrow_types: Dict[str, str],
+) -> str:
+    """Build the export in spooled buffers and upload them without a local copy."""
+    s3_exporter = S3Exporter(settings.s3_bucket)
+    with ExitStack() as stack:
+        csv_buffer = stack.enter_context(tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES))
+        parquet_buffer = (
+            stack.enter_context(tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)) if with_parquet else None
+        )
+        
+        csv_sink: BinaryIO = csv_buffer
+        if settings.export_gzip:
+            csv_sink = gzip.GzipFile(fileobj=csv_buffer, mode="wb", compresslevel=GZIP_COMPRESSLEVEL)
+        
+        text = io.TextIOWrapper(csv_sink, encoding="utf-8", newline="")
+        _write_rows(text, parquet_buffer, header, row_fn, records, arrow_types)
+        text.flush()
+        text.detach()  # Leave csv_buffer open for the upload
+        if csv_sink is not csv_buffer:
+            csv_sink.close()  # Writes the gzip trailer; csv_buffer stays open
+        
+        # A .csv.gz download should stay gzipped, so no ContentEncoding (clients would inflate it)
+        csv_extra_args = {"ContentType": "application/gzip" if settings.export_gzip else "text/csv"}
+        
+        outputs = [(filename, csv_buffer, csv_extra_args)]
+        if parquet_buffer is not None:
+            outputs.append((parquet_name, parquet_buffer, None))
+        for _, buffer, _ in outputs:
+            buffer.seek(0)
+        # The CSV and Parquet objects upload side by side
+        urls = s3_exporter.upload_files(
+            [(buffer, f"exports/{name}", extra_args) for name, buffer, extra_args in outputs]
+        )
+        locations = [url or _save_locally(name, buffer) for url, (name, buffer, _) in zip(urls, outputs)]
+    
+    return locations[0]
+
+
+def _save_locally(name: str, buffer: BinaryIO) -> str:
+    """Keep an export whose upload failed in the local export directory."""
+    path = ensure_export_dir() / name
+    buffer.seek(0)
+    with path.open("wb") as f:
+        shutil.copyfileobj(buffer, f)
+    return str(path)
+
+
+def _slug(parts: Sequence[str]) -> str:
+    """Join parts for a filename, capped so long filter lists keep names short but unique."""
+    head = "-".join(parts[:SLUG_MAX_PARTS])
+    if len(parts) <= SLUG_MAX_PARTS:
+        return head
+    digest = hashlib.blake2b("\x1f".join(parts).encode(), digest_size=4).hexdigest()
+    return f"{head}-{digest}"
+
+
+def export_business_csv(records: Iterable[BusinessCanonical], payload: BusinessPullRequest) -> str:
+    states_slug = _slug(sorted(payload.states))
+    filter_slug = _slug(payload.naics or payload.keywords or ["all"])
+    date_prefix = utcnow().strftime("%Y%m%d")
+    filename = f"business-{date_prefix}-{states_slug}-{filter_slug}.csv"
+
+    return _write_export(filename, BUSINESS_HEADER, _business_row, records, BUSINESS_ARROW_TYPES)
+
+
 def export_rfp_csv(records: Iterable[RFPCanonical], payload: RFPPullRequest) -> str:
-    export_dir = ensure_export_dir()
-    states_slug = "-".join(sorted(payload.states))
-    filter_slug = "-".join((payload.naics or payload.keywords or ["all"]))
-    date_prefix = dt.datetime.utcnow().strftime("%Y%m%d")
+    states_slug = _slug(sorted(payload.states))
+    filter_slug = _slug(payload.naics or payload.keywords or ["all"])
+    date_prefix = utcnow().strftime("%Y%m%d")
     filename = f"rfps-{date_prefix}-{states_slug}-{filter_slug}.csv"
-    path = export_dir / filename
 
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(RFP_HEADER)
-        for record in records:
-            writer.writerow(
-                [
-                    record.notice_id,
-                    record.title,
-                    record.agency or "",
-                    record.naics or "",
-                    record.solicitation_number or "",
-                    record.notice_type or "",
-                    record.posted_date.isoformat() if record.posted_date else "",
-                    record.close_date.isoformat() if record.close_date else "",
-                    record.place_of_performance_state or "",
-                    record.description or "",
-                    record.url or "",
-                    record.contact_name or "",
-                    record.contact_email or "",
-                    record.estimated_value or "",
-                    record.source,
-                    record.last_checked.isoformat(),
-                ]
-            )
-    
-    # Upload to S3 if configured
-    if settings.s3_bucket:
-        s3_exporter = S3Exporter(settings.s3_bucket)
-        s3_key = f"exports/{filename}"
-        return s3_exporter.upload_file(path, s3_key)
-    
-    return str(path)
+    return _write_export(filename, RFP_HEADER, _rfp_row, records, RFP_ARROW_TYPES)
 
 
@@ -6,18 +6,35 @@ Auth: None for search2 (per docs)
 Key params: keywords, posted date range
 Tag: source="grants.gov"
 """
+import asyncio
 import logging
-import time
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Dict, List, Optional, Any
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from core.config import settings
+from core.httputil import fetch_offset_pages, response_json, retry_page
 
 logger = logging.getLogger(__name__)
 
 GRANTS_GOV_ENDPOINT = "https://www.grants.gov/api/search2"
 MAX_PER_PAGE = 100  # API limit
+MAX_CONCURRENT_PAGES = 4
+
+# (Search2 field, RFP schema field) pairs copied as stripped strings
+GRANT_FIELD_MAP = (
+    ("opportunityId", "notice_id"),
+    ("title", "title"),
+    ("agency", "agency"),
+    ("naics", "naics"),
+    ("opportunityNumber", "solicitation_number"),
+    ("postedDate", "posted_date"),
+    ("closeDate", "close_date"),
+    ("state", "place_of_performance_state"),
+    ("description", "description"),
+    ("url", "url"),
+    ("contactName", "contact_name"),
+    ("contactEmail", "contact_email"),
+)
 
 
 class GrantsGovConnector:
@@ -28,34 +45,66 @@ class GrantsGovConnector:
         if not self.enabled:
             logger.info("Grants.gov connector disabled - set include_grants=true to enable")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    def _make_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Make API request with retry logic."""
+    @retry_page
+    async def _get_page(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        async with semaphore:
+            response = await client.get(GRANTS_GOV_ENDPOINT, params=params)
+        response.raise_for_status()
+        return response_json(response)
+    
+    async def _make_request(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Make API request, retrying network errors, 429 and 5xx."""
         if not self.enabled:
             return {"results": []}
         
+        logger.debug(f"Grants.gov API call: {GRANTS_GOV_ENDPOINT} with params: {params}")
+        
         try:
-            response = httpx.get(
-                GRANTS_GOV_ENDPOINT,
-                params=params,
-                timeout=30,
-                headers={"User-Agent": "DataForge/1.0"}
-            )
-            response.raise_for_status()
-            return response.json()
+            return await self._get_page(client, semaphore, params)
         except httpx.HTTPError as e:
             logger.error(f"Grants.gov API request failed: {e}")
             return {"results": []}
     
+    @staticmethod
+    def _hit_count(data: Dict[str, Any]) -> Optional[int]:
+        """Total matches reported by Search2, if present."""
+        value = data.get("hitCount", data.get("total"))
+        try:
+            return int(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+    
+    async def _fetch_pages(self, base_params: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+        """Fetch raw results, requesting the remaining pages concurrently."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+        async with httpx.AsyncClient(timeout=30, headers={"User-Agent": "DataForge/1.0"}) as client:
+            def fetch_page(offset: int, count: int) -> Awaitable[Dict[str, Any]]:
+                return self._make_request(client, semaphore, {**base_params, "offset": offset, "limit": count})
+            
+            return await fetch_offset_pages(
+                fetch_page, "results", self._hit_count, limit, MAX_PER_PAGE, MAX_CONCURRENT_PAGES
+            )
+    
     def search_grants(
         self,
         keywords: Optional[List[str]] = None,
         posted_from: Optional[str] = None,
         posted_to: Optional[str] = None,
         limit: int = 500
+    ) -> List[Dict[str, Any]]:
+        """Synchronous wrapper around search_grants_async."""
+        return asyncio.run(self.search_grants_async(keywords, posted_from, posted_to, limit))
+    
+    async def search_grants_async(
+        self,
+        keywords: Optional[List[str]] = None,
+        posted_from: Optional[str] = None,
+        posted_to: Optional[str] = None,
+        limit: int = 500
     ) -> List[Dict[str, Any]]:
         """
         Search grants from Grants.gov.
@@ -73,13 +122,8 @@ class GrantsGovConnector:
             logger.info("Grants.gov connector disabled - returning empty results")
             return []
         
-        all_grants = []
-        
         # Build search parameters
-        params = {
-            "limit": min(MAX_PER_PAGE, limit),
-            "offset": 0
-        }
+        params: Dict[str, Any] = {}
         
         # Add keywords
         if keywords:
@@ -93,94 +137,33 @@ class GrantsGovConnector:
         
         logger.info(f"Searching Grants.gov with params: {params}")
         
-        # Paginate through results
-        while len(all_grants) < limit:
-            params["offset"] = len(all_grants)
-            params["limit"] = min(MAX_PER_PAGE, limit - len(all_grants))
-            
-            logger.debug(f"Grants.gov API call: {GRANTS_GOV_ENDPOINT} with params: {params}")
-            
-            data = self._make_request(params)
-            grants = data.get("results", [])
-            
-            if not grants:
-                logger.info(f"No more grants found at offset {params['offset']}")
-                break
-            
-            # Process and normalize grant data
-            for grant in grants:
-                if len(all_grants) >= limit:
-                    break
-                
-                normalized = self._normalize_grant(grant)
-                if normalized:
-                    all_grants.append(normalized)
-            
-            # Rate limiting
-            time.sleep(0.1)
-            
+        raw_grants = await self._fetch_pages(params, limit)
+        
+        # Normalize once every page is in
+        all_grants = []
+        for grant in raw_grants:
             if len(all_grants) >= limit:
                 break
+            
+            normalized = self._normalize_grant(grant)
+            if normalized:
+                all_grants.append(normalized)
         
         logger.info(f"Grants.gov search completed: {len(all_grants)} grants found")
-        return all_grants[:limit]
+        return all_grants
     
     def _normalize_grant(self, grant: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Normalize Grants.gov grant data to our RFP schema."""
         try:
-            # Extract basic info
-            opportunity_id = grant.get("opportunityId", "").strip()
-            if not opportunity_id:
+            normalized = {dst: str(grant.get(src) or "").strip() for src, dst in GRANT_FIELD_MAP}
+            if not normalized["notice_id"]:
                 return None
             
-            title = grant.get("title", "").strip()
-            agency = grant.get("agency", "").strip()
-            
-            # Extract NAICS (if available)
-            naics = grant.get("naics", "").strip()
-            
-            # Extract solicitation info
-            solicitation_number = grant.get("opportunityNumber", "").strip()
-            notice_type = "Grant"  # Grants.gov is primarily for grants
-            
-            # Extract dates
-            posted_date = grant.get("postedDate", "").strip()
-            close_date = grant.get("closeDate", "").strip()
-            
-            # Extract location
-            state = grant.get("state", "").strip()
-            
-            # Extract description
-            description = grant.get("description", "").strip()
-            
-            # Extract URL
-            url = grant.get("url", "").strip()
-            
-            # Extract contact info
-            contact_name = grant.get("contactName", "").strip()
-            contact_email = grant.get("contactEmail", "").strip()
-            
-            # Extract estimated value
-            estimated_value = grant.get("estimatedValue", 0)
-            
-            return {
-                "notice_id": opportunity_id,
-                "title": title,
-                "agency": agency,
-                "naics": naics,
-                "solicitation_number": solicitation_number,
-                "notice_type": notice_type,
-                "posted_date": posted_date,
-                "close_date": close_date,
-                "place_of_performance_state": state,
-                "description": description,
-                "url": url,
-                "contact_name": contact_name,
-                "contact_email": contact_email,
-                "estimated_value": estimated_value,
-                "source": "grants.gov",
-                "last_checked": None  # Will be set by pipeline
-            }
+            normalized["notice_type"] = "Grant"  # Grants.gov is primarily for grants
+            normalized["estimated_value"] = grant.get("estimatedValue", 0)
+            normalized["source"] = "grants.gov"
+            normalized["last_checked"] = None  # Will be set by pipeline
+            return normalized
             
         except Exception as e:
             logger.error(f"Error normalizing Grants.gov grant: {e}")
@@ -211,3 +194,12 @@ def ingest_grants_gov(
     """
     return grants_connector.search_grants(keywords, posted_from, posted_to, limit)
 
+
+async def ingest_grants_gov_async(
+    keywords: Optional[List[str]] = None,
+    posted_from: Optional[str] = None,
+    posted_to: Optional[str] = None,
+    limit: int = 500
+) -> List[Dict[str, Any]]:
+    """ingest_grants_gov for callers already inside an event loop."""
+    return await grants_connector.search_grants_async(keywords, posted_from, posted_to, limit)
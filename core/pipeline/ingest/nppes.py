@@ -6,24 +6,220 @@ Method: Download monthly ZIP files, parse organizations (Entity Type 2)
 Extract: name, phones, practice address, taxonomy/specialty
 Tag: source="nppes"
 """
+import hashlib
+import io
+import json
 import logging
+import mmap
 import os
+import re
+import sqlite3
+import struct
 import tempfile
+import time
 import zipfile
+from contextlib import closing, contextmanager
 from datetime import datetime
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import csv
+from typing import Any, BinaryIO, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from core.config import settings
+from core.textmatch import KeywordMatcher, compile_keywords
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent workers are not coordinated
+    fcntl = None
+
+try:
+    from isal import isal_zlib
+except ImportError:  # Optional speedup: pip install "dataforge[isal]"
+    isal_zlib = None
 
 logger = logging.getLogger(__name__)
 
 NPPES_BASE_URL = "https://download.cms.gov/nppes/NPI_Files.html"
 NPPES_DOWNLOAD_URL = "https://download.cms.gov/nppes/NPPES_Data_Dissemination_{month}_{year}.zip"
 
+# The dissemination CSV has ~330 columns; only these are parsed
+NPPES_COLS = frozenset({
+    "NPI",
+    "Entity Type Code",
+    "Provider Organization Name (Legal Business Name)",
+    "Provider First Line Business Practice Location Address",
+    "Provider Business Practice Location Address City Name",
+    "Provider Business Practice Location Address State Name",
+    "Provider Business Practice Location Address Postal Code",
+    "Provider Business Practice Location Address Telephone Number",
+    "Provider Business Practice Location Address Fax Number",
+    "Healthcare Provider Taxonomy Code_1",
+    "Provider License Number_1",
+    "Provider Enumeration Date",
+    "Last Update Date",
+})
+# Columns stored in the per-ZIP SQLite index (the entity type is filtered at build time)
+NPPES_INDEX_COLS = tuple(sorted(NPPES_COLS - {"Entity Type Code"}))
+NPPES_CHUNK_ROWS = 250_000
+ZIP_READ_BUFFER = 1 << 20  # Inflate the CSV member in 1 MiB reads
+ZIP_LOCAL_HEADER_SIZE = 30  # Fixed part of a ZIP local file header
+
+# (NPPES column, organization field) pairs copied as stripped strings
+NPPES_FIELD_MAP = (
+    ("Provider Organization Name (Legal Business Name)", "company_name"),
+    ("Provider Business Practice Location Address Telephone Number", "phone"),
+    ("Provider First Line Business Practice Location Address", "address_line1"),
+    ("Provider Business Practice Location Address City Name", "city"),
+    ("Provider Business Practice Location Address State Name", "state"),
+    ("Provider Business Practice Location Address Postal Code", "postal_code"),
+    ("Provider License Number_1", "industry"),
+    ("NPI", "npi"),
+    ("Healthcare Provider Taxonomy Code_1", "taxonomy_code"),
+    ("Provider Business Practice Location Address Fax Number", "fax"),
+    ("Provider Enumeration Date", "enumeration_date"),
+    ("Last Update Date", "last_update"),
+)
+NPPES_SOURCE_COLS = [src for src, _ in NPPES_FIELD_MAP]
+ORGANIZATION_FIELDS = (
+    "company_name", "domain", "phone", "email", "address_line1", "city", "state",
+    "postal_code", "country", "naics_code", "industry", "founded_year",
+    "years_in_business", "employee_count", "annual_revenue_usd", "business_size",
+    "is_small_business", "source", "last_verified", "quality_score",
+    "npi", "taxonomy_code", "fax", "enumeration_date", "last_update",
+)
+STATE_COL = "Provider Business Practice Location Address State Name"
+NAME_COL = "Provider Organization Name (Legal Business Name)"
+LICENSE_COL = "Provider License Number_1"
+TAXONOMY_COL = "Healthcare Provider Taxonomy Code_1"
+
+INDEX_TTL_SECONDS = 24 * 60 * 60  # The monthly file list changes rarely
+DISSEMINATION_RE = re.compile(r'NPPES_Data_Dissemination_([A-Za-z]+)_(\d{4})\.zip$')
+MONTH_NUMBERS = {
+    name: number
+    for number, name in enumerate(
+        ("january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"),
+        start=1,
+    )
+}
+
+
+@contextmanager
+def _exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``lock_path`` across processes.
+    
+    The kernel releases it if the holder dies, so a crashed worker never
+    leaves a stale lock. Without fcntl this is a no-op.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class _IsalMemberReader(io.RawIOBase):
+    """A DEFLATE ZIP member inflated with ISA-L, read straight from the archive file.
+    
+    zipfile has no public hook for swapping its decompressor, so the member's
+    compressed bytes are located from its documented ZipInfo fields and local
+    header and fed to ``isal_zlib``. The CRC-32 is checked at the end, as
+    zipfile does.
+    """
+    
+    def __init__(self, archive: BinaryIO, info: zipfile.ZipInfo):
+        super().__init__()
+        archive.seek(info.header_offset)
+        header = archive.read(ZIP_LOCAL_HEADER_SIZE)
+        if len(header) != ZIP_LOCAL_HEADER_SIZE or header[:4] != b"PK\x03\x04":
+            raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        archive.seek(name_length + extra_length, io.SEEK_CUR)
+        
+        self._archive = archive
+        self._info = info
+        self._remaining = info.compress_size
+        self._inflater = isal_zlib.decompressobj(-isal_zlib.MAX_WBITS)
+        self._crc = 0
+        self._pending = memoryview(b"")
+        self._done = False
+    
+    def readable(self) -> bool:
+        return True
+    
+    def _inflate_more(self) -> None:
+        chunk = self._archive.read(min(ZIP_READ_BUFFER, self._remaining))
+        self._remaining -= len(chunk)
+        if chunk:
+            data = self._inflater.decompress(chunk)
+        elif self._remaining:
+            raise zipfile.BadZipFile(f"Truncated member {self._info.filename}")
+        else:
+            data = self._inflater.flush()
+            self._done = True
+        self._crc = isal_zlib.crc32(data, self._crc)
+        if self._done and self._crc != self._info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {self._info.filename!r}")
+        self._pending = memoryview(data)
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending and not self._done:
+            self._inflate_more()
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+@contextmanager
+def _open_member(zip_ref: zipfile.ZipFile, zip_path: Path, name: str) -> Iterator[BinaryIO]:
+    """Open a ZIP member for reading, inflating DEFLATE members with ISA-L when installed."""
+    info = zip_ref.getinfo(name)
+    encrypted = info.flag_bits & 0x1
+    if isal_zlib is None or info.compress_type != zipfile.ZIP_DEFLATED or encrypted:
+        with zip_ref.open(info) as member:
+            yield member
+        return
+    with open(zip_path, "rb") as archive, _IsalMemberReader(archive, info) as member:
+        yield member
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only mmap usable as a ZipFile source (mmap has no seekable() before Python 3.13)."""
+    
+    def seekable(self) -> bool:
+        return True
+
+
+class _HrefCollector(HTMLParser):
+    """Collects the href of every <a> tag."""
+    
+    def __init__(self):
+        super().__init__()
+        self.hrefs: List[str] = []
+    
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.hrefs.append(href.strip())
+
+
+def _extract_hrefs(html: str) -> List[str]:
+    collector = _HrefCollector()
+    collector.feed(html)
+    collector.close()
+    return collector.hrefs
+
 
 class NPPESConnector:
     """NPPES healthcare organizations connector."""
@@ -31,37 +227,60 @@ class NPPESConnector:
     def __init__(self):
         self.cache_dir = Path(settings.export_bucket_path) / "nppes_cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._latest_file_info: Optional[Tuple[float, Dict[str, str]]] = None
+        self._session: Optional[requests.Session] = None
+    
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session shared by the index page and ZIP downloads."""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers["User-Agent"] = "DataForge/1.0"
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
+    
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
     def _get_latest_file_info(self) -> Dict[str, str]:
+        """Get the latest NPPES file information, re-reading the index page at most daily."""
+        cached = self._latest_file_info
+        if cached and time.monotonic() - cached[0] < INDEX_TTL_SECONDS:
+            return cached[1]
+        
+        info = self._fetch_latest_file_info()
+        self._latest_file_info = (time.monotonic(), info)
+        return info
+    
+    def _fetch_latest_file_info(self) -> Dict[str, str]:
         """Get the latest NPPES file information from the download page."""
         try:
-            response = requests.get(NPPES_BASE_URL, timeout=30)
+            response = self.session.get(NPPES_BASE_URL, timeout=30)
             response.raise_for_status()
-            content = response.text
-            
-            # Parse the HTML to find the latest ZIP file
-            # This is a simplified parser - in production, you'd want more robust HTML parsing
-            import re
             
-            # Look for ZIP file links
-            zip_pattern = r'href="([^"]*NPPES_Data_Dissemination_[^"]*\.zip)"'
-            matches = re.findall(zip_pattern, content)
+            # Pick the newest monthly file by its date, not its position on the page
+            candidates = []
+            for href in _extract_hrefs(response.text):
+                date_match = DISSEMINATION_RE.search(href)
+                if not date_match:
+                    continue
+                month, year = date_match.groups()
+                month_number = MONTH_NUMBERS.get(month.lower())
+                if month_number:
+                    candidates.append(((int(year), month_number), href, month, year))
             
-            if matches:
-                # Get the most recent file
-                latest_file = matches[-1]
-                # Extract month and year from filename
-                date_pattern = r'NPPES_Data_Dissemination_(\w+)_(\d{4})\.zip'
-                date_match = re.search(date_pattern, latest_file)
-                
-                if date_match:
-                    month, year = date_match.groups()
-                    return {
-                        "url": latest_file,
-                        "month": month,
-                        "year": year,
-                        "filename": os.path.basename(latest_file)
-                    }
+            if candidates:
+                _, href, month, year = max(candidates)
+                return {
+                    "url": urljoin(NPPES_BASE_URL, href),
+                    "month": month,
+                    "year": year,
+                    "filename": os.path.basename(href)
+                }
             
             # Fallback to current month/year
             now = datetime.now()
@@ -89,157 +308,367 @@ class NPPESConnector:
                 "filename": f"NPPES_Data_Dissemination_{now.strftime('%B')}_{now.year}.zip"
             }
     
-    def _is_file_cached(self, filename: str) -> bool:
-        """Check if the NPPES file is already cached."""
-        cache_file = self.cache_dir / filename
-        return cache_file.exists()
+    @staticmethod
+    def _meta_path(cache_file: Path) -> Path:
+        return cache_file.with_suffix(".meta.json")
+    
+    def _read_meta(self, cache_file: Path) -> Dict[str, Any]:
+        try:
+            return json.loads(self._meta_path(cache_file).read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _sha256(path: Path) -> str:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    
+    @staticmethod
+    def _stat_fields(path: Path) -> Dict[str, int]:
+        stat = path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    
+    def _verify_cache(self, cache_file: Path, url: str) -> Dict[str, Any]:
+        """
+        Return the cached file's metadata if it was downloaded from ``url`` and
+        is still intact; an empty dict means it must be fetched again.
+        
+        The SHA-256 is taken while downloading. Later runs trust an unchanged
+        size and mtime and only re-hash the multi-GB file when those moved.
+        """
+        meta = self._read_meta(cache_file)
+        if not cache_file.exists() or meta.get("url") != url or not meta.get("sha256"):
+            return {}
+        stat_fields = self._stat_fields(cache_file)
+        if all(meta.get(field) == value for field, value in stat_fields.items()):
+            return meta
+        if self._sha256(cache_file) != meta["sha256"]:
+            logger.warning(f"Cached NPPES file failed digest check, re-downloading: {cache_file.name}")
+            return {}
+        meta.update(stat_fields)
+        self._meta_path(cache_file).write_text(json.dumps(meta))
+        return meta
+    
+    def _download_file(self, url: str, filename: str) -> Path:
+        """Download NPPES ZIP file to cache, one process at a time per file."""
+        # Workers sharing the cache directory wait here, then revalidate the
+        # copy the first one fetched instead of downloading it again.
+        with _exclusive_lock(self.cache_dir / f"{filename}.lock"):
+            return self._fetch_file(url, filename)
     
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10)
     )
-    def _download_file(self, url: str, filename: str) -> Path:
-        """Download NPPES ZIP file to cache."""
+    def _fetch_file(self, url: str, filename: str) -> Path:
+        """Download NPPES ZIP file to cache, revalidating any cached copy."""
         cache_file = self.cache_dir / filename
+        meta = self._verify_cache(cache_file, url)
         
-        if self._is_file_cached(filename):
-            logger.info(f"NPPES file already cached: {filename}")
-            return cache_file
+        # A conditional GET turns an unchanged multi-GB file into a 304
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        
+        # Resume an interrupted download of the same file version with a Range
+        # request; If-Range makes the server send the whole file if it changed.
+        partial_file = cache_file.with_suffix(".part")
+        partial_meta_path = cache_file.with_suffix(".part.json")
+        offset = 0
+        if partial_file.exists():
+            try:
+                partial_meta = json.loads(partial_meta_path.read_text())
+            except (OSError, ValueError):
+                partial_meta = {}
+            validator = partial_meta.get("etag") or partial_meta.get("last_modified")
+            if partial_meta.get("url") == url and partial_meta.get("accept_ranges") == "bytes" and validator:
+                offset = partial_file.stat().st_size
+                headers["Range"] = f"bytes={offset}-"
+                headers["If-Range"] = validator
         
-        logger.info(f"Downloading NPPES file: {url}")
+        logger.info(f"Downloading NPPES file: {url}" + (f" (resuming at byte {offset})" if offset else ""))
         
         try:
-            response = requests.get(url, timeout=300, stream=True)
+            response = self.session.get(url, timeout=300, stream=True, headers=headers)
+            if response.status_code == 304 and meta:
+                logger.info(f"NPPES file not modified, using cache: {filename}")
+                return cache_file
+            if response.status_code == 416:
+                # Partial file is unusable for this range; start over on the next attempt
+                partial_file.unlink(missing_ok=True)
             response.raise_for_status()
             
-            with open(cache_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            digest = hashlib.sha256()
+            if response.status_code == 206:
+                with open(partial_file, "rb") as f:
+                    digest = hashlib.file_digest(f, "sha256")
+                mode = "ab"
+            else:
+                mode = "wb"
+                partial_meta_path.write_text(json.dumps({
+                    "url": url,
+                    "etag": response.headers.get("ETag", ""),
+                    "last_modified": response.headers.get("Last-Modified", ""),
+                    "accept_ranges": response.headers.get("Accept-Ranges", ""),
+                }))
+            
+            # Write to a temporary name so an interrupted download never looks cached
+            with open(partial_file, mode) as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
                     f.write(chunk)
+                    digest.update(chunk)
+            os.replace(partial_file, cache_file)
+            partial_meta_path.unlink(missing_ok=True)
+            
+            self._meta_path(cache_file).write_text(json.dumps({
+                "url": url,
+                "etag": response.headers.get("ETag", ""),
+                "last_modified": response.headers.get("Last-Modified", ""),
+                "sha256": digest.hexdigest(),
+                **self._stat_fields(cache_file),
+            }))
             
             logger.info(f"NPPES file downloaded and cached: {filename}")
             return cache_file
             
+        except requests.RequestException as e:
+            if meta:
+                logger.warning(f"NPPES revalidation failed, using verified cache: {e}")
+                return cache_file
+            logger.error(f"Error downloading NPPES file: {e}")
+            raise
         except Exception as e:
             logger.error(f"Error downloading NPPES file: {e}")
             raise
     
-    def _extract_organizations(self, zip_path: Path) -> List[Dict[str, Any]]:
-        """Extract organization records from NPPES ZIP file."""
-        organizations = []
+    @staticmethod
+    @contextmanager
+    def _open_zip(zip_path: Path) -> Iterator[zipfile.ZipFile]:
+        """Open the ZIP over a read-only memory map, falling back to plain file reads."""
+        with open(zip_path, "rb") as raw:
+            try:
+                mapped = _MappedFile(raw.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Cannot memory-map {zip_path.name}, reading it directly: {e}")
+                mapped = None
+            
+            if mapped is None:
+                with zipfile.ZipFile(raw) as zip_ref:
+                    yield zip_ref
+            else:
+                with mapped, zipfile.ZipFile(mapped) as zip_ref:
+                    yield zip_ref
+    
+    def _iter_organization_chunks(self, zip_path: Path) -> Iterator[pd.DataFrame]:
+        """Yield column-projected chunks of Entity Type 2 rows from the NPPES ZIP."""
+        with self._open_zip(zip_path) as zip_ref:
+            # Find the CSV file in the ZIP
+            csv_files = [f for f in zip_ref.namelist() if f.endswith('.csv')]
+            
+            if not csv_files:
+                logger.error("No CSV files found in NPPES ZIP")
+                return
+            
+            csv_file = csv_files[0]  # Use the first CSV file
+            logger.info(f"Processing NPPES CSV file: {csv_file}")
+            
+            with _open_member(zip_ref, zip_path, csv_file) as member:
+                with io.BufferedReader(member, ZIP_READ_BUFFER) as csv_file_obj:
+                    # Stream the CSV in chunks, parsing only the columns we use
+                    reader = pd.read_csv(
+                        csv_file_obj,
+                        usecols=lambda column: column in NPPES_COLS,
+                        dtype=str,
+                        na_filter=False,
+                        chunksize=NPPES_CHUNK_ROWS,
+                        encoding="utf-8",
+                        encoding_errors="ignore",
+                    )
+                    
+                    for chunk in reader:
+                        # Only process organizations (Entity Type 2)
+                        yield chunk[chunk["Entity Type Code"] == "2"]
+    
+    def _collect(
+        self,
+        frame: pd.DataFrame,
+        keyword_match: Optional[KeywordMatcher],
+        limit: int,
+        organizations: List[Dict[str, Any]],
+    ) -> bool:
+        """Keyword-filter a chunk and normalize the rows kept into ``organizations``; True once ``limit`` is reached.
+        
+        Only the name, license and taxonomy columns are read to decide which rows
+        survive, so the remaining columns are normalized for at most ``limit`` rows.
+        """
+        frame = frame.reindex(columns=NPPES_SOURCE_COLS, fill_value="")
+        names = frame[NAME_COL].str.strip()
+        frame = frame[(names != "").to_numpy()]
+        if keyword_match and not frame.empty:
+            industry = frame[LICENSE_COL].str.strip()
+            text = (
+                names.loc[frame.index]
+                + " " + industry.mask(industry == "", "Healthcare")
+                + " " + frame[TAXONOMY_COL].str.strip()
+            ).str.lower()
+            frame = frame[text.map(keyword_match).to_numpy(dtype=bool)]
+        
+        orgs = self._normalize_frame(frame.head(limit - len(organizations)))
+        organizations.extend(orgs.to_dict("records"))
+        if len(organizations) >= limit:
+            logger.info(f"Reached limit of {limit} NPPES organizations")
+            return True
+        return False
+    
+    def _extract_organizations(
+        self,
+        zip_path: Path,
+        state_set: FrozenSet[str],
+        keyword_match: Optional[KeywordMatcher],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract organization records from NPPES ZIP file.
+        
+        State and keyword filters run during the scan, so rejected rows are
+        never normalized, and the scan stops once ``limit`` records match.
+        """
+        organizations: List[Dict[str, Any]] = []
         
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Find the CSV file in the ZIP
-                csv_files = [f for f in zip_ref.namelist() if f.endswith('.csv')]
-                
-                if not csv_files:
-                    logger.error("No CSV files found in NPPES ZIP")
+            for chunk in self._iter_organization_chunks(zip_path):
+                chunk = chunk[chunk[STATE_COL].str.strip().str.upper().isin(state_set)]
+                if self._collect(chunk, keyword_match, limit, organizations):
                     return organizations
-                
-                csv_file = csv_files[0]  # Use the first CSV file
-                logger.info(f"Processing NPPES CSV file: {csv_file}")
-                
-                with zip_ref.open(csv_file) as csv_file_obj:
-                    # Read CSV with proper encoding
-                    content = csv_file_obj.read().decode('utf-8', errors='ignore')
-                    csv_reader = csv.DictReader(content.splitlines())
-                    
-                    for row in csv_reader:
-                        # Only process organizations (Entity Type 2)
-                        if row.get('Entity Type Code') == '2':
-                            org = self._normalize_organization(row)
-                            if org:
-                                organizations.append(org)
-                
-                logger.info(f"Extracted {len(organizations)} organizations from NPPES")
-                
+            
+            logger.info(f"Extracted {len(organizations)} organizations from NPPES")
+            
         except Exception as e:
             logger.error(f"Error extracting organizations from NPPES: {e}")
         
         return organizations
     
-    def _normalize_organization(self, row: Dict[str, str]) -> Optional[Dict[str, Any]]:
-        """Normalize NPPES organization data to our schema."""
+    @staticmethod
+    def _index_path(zip_path: Path) -> Path:
+        return zip_path.with_suffix(".sqlite3")
+    
+    @staticmethod
+    def _index_source_key(zip_path: Path) -> str:
+        stat = zip_path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+    
+    def _ensure_index(self, zip_path: Path) -> Optional[Path]:
+        """
+        Build (once per ZIP) a SQLite table of NPPES organizations indexed by
+        state, so later searches read only the requested states' rows.
+        Returns None if the index cannot be built.
+        """
+        with _exclusive_lock(self._index_path(zip_path).with_suffix(".lock")):
+            return self._build_index(zip_path)
+    
+    def _build_index(self, zip_path: Path) -> Optional[Path]:
+        index_path = self._index_path(zip_path)
+        source_key = self._index_source_key(zip_path)
+        
+        if index_path.exists():
+            try:
+                with closing(sqlite3.connect(index_path)) as conn:
+                    row = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+                if row and row[0] == source_key:
+                    return index_path
+            except sqlite3.Error:
+                pass
+        
+        logger.info(f"Building NPPES index: {index_path.name}")
+        building_path = index_path.with_suffix(".building")
+        building_path.unlink(missing_ok=True)
+        columns = ", ".join(f"c{i} TEXT" for i in range(len(NPPES_INDEX_COLS)))
+        placeholders = ", ".join("?" * (len(NPPES_INDEX_COLS) + 1))
+        
         try:
-            # Extract basic info
-            name = row.get('Provider Organization Name (Legal Business Name)', '').strip()
-            if not name:
-                return None
-            
-            # Extract address (practice location)
-            address_line1 = row.get('Provider First Line Business Practice Location Address', '').strip()
-            city = row.get('Provider Business Practice Location Address City Name', '').strip()
-            state = row.get('Provider Business Practice Location Address State Name', '').strip()
-            postal_code = row.get('Provider Business Practice Location Address Postal Code', '').strip()
-            
-            # Extract contact info
-            phone = row.get('Provider Business Practice Location Address Telephone Number', '').strip()
-            fax = row.get('Provider Business Practice Location Address Fax Number', '').strip()
-            
-            # Extract taxonomy/specialty
-            taxonomy_code = row.get('Healthcare Provider Taxonomy Code_1', '').strip()
-            taxonomy_desc = row.get('Provider License Number_1', '').strip()  # Often contains specialty info
-            
-            # Extract NPI
-            npi = row.get('NPI', '').strip()
-            
-            # Extract dates
-            enumeration_date = row.get('Provider Enumeration Date', '').strip()
-            last_update = row.get('Last Update Date', '').strip()
-            
-            return {
-                "company_name": name,
-                "domain": None,  # Will be enriched later
-                "phone": phone,
-                "email": None,  # Will be enriched later
-                "address_line1": address_line1,
-                "city": city,
-                "state": state.upper() if state else None,
-                "postal_code": postal_code,
-                "country": "US",
-                "naics_code": None,  # Will be enriched later
-                "industry": taxonomy_desc or "Healthcare",
-                "founded_year": self._extract_year(enumeration_date),
-                "years_in_business": None,  # Will be calculated
-                "employee_count": None,
-                "annual_revenue_usd": None,
-                "business_size": None,
-                "is_small_business": None,
-                "source": "nppes",
-                "last_verified": None,  # Will be set by pipeline
-                "quality_score": 0,
-                "npi": npi,
-                "taxonomy_code": taxonomy_code,
-                "fax": fax,
-                "enumeration_date": enumeration_date,
-                "last_update": last_update
-            }
-            
-        except Exception as e:
-            logger.error(f"Error normalizing NPPES organization: {e}")
+            with closing(sqlite3.connect(building_path)) as conn:
+                conn.execute(f"CREATE TABLE orgs (state TEXT, {columns})")
+                conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                for chunk in self._iter_organization_chunks(zip_path):
+                    chunk = chunk.assign(_state=chunk[STATE_COL].str.strip().str.upper())
+                    conn.executemany(
+                        f"INSERT INTO orgs VALUES ({placeholders})",
+                        chunk.reindex(columns=["_state", *NPPES_INDEX_COLS], fill_value="")
+                        .itertuples(index=False, name=None),
+                    )
+                conn.execute("CREATE INDEX orgs_state ON orgs (state)")
+                conn.execute("INSERT INTO meta VALUES ('source', ?)", (source_key,))
+                conn.commit()
+            os.replace(building_path, index_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Error building NPPES index, scanning the ZIP instead: {e}")
+            building_path.unlink(missing_ok=True)
             return None
+        
+        return index_path
     
-    def _extract_year(self, date_str: str) -> Optional[int]:
-        """Extract year from date string."""
-        if not date_str:
-            return None
+    def _query_index(
+        self,
+        index_path: Path,
+        state_set: FrozenSet[str],
+        keyword_match: Optional[KeywordMatcher],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Read the requested states from the index, in original file order."""
+        organizations: List[Dict[str, Any]] = []
+        if not state_set:
+            return organizations
         
-        try:
-            # Handle various date formats
-            if "-" in date_str:
-                year = int(date_str.split("-")[0])
-            elif "/" in date_str:
-                year = int(date_str.split("/")[-1])
-            else:
-                year = int(date_str[:4])
-            
-            # Sanity check
-            if 1800 <= year <= 2030:
-                return year
-        except (ValueError, IndexError):
-            pass
+        states = sorted(state_set)
+        columns = ", ".join(f"c{i}" for i in range(len(NPPES_INDEX_COLS)))
+        with closing(sqlite3.connect(index_path)) as conn:
+            cursor = conn.execute(
+                f"SELECT {columns} FROM orgs WHERE state IN ({', '.join('?' * len(states))}) ORDER BY rowid",
+                states,
+            )
+            while rows := cursor.fetchmany(NPPES_CHUNK_ROWS):
+                frame = pd.DataFrame.from_records(rows, columns=NPPES_INDEX_COLS)
+                if self._collect(frame, keyword_match, limit, organizations):
+                    break
+        
+        return organizations
+    
+    @staticmethod
+    def _extract_years(dates: pd.Series) -> pd.Series:
+        """Year of each YYYY-MM-DD, MM/DD/YYYY or YYYY... date; None if missing or implausible."""
+        year_str = dates.str[:4]
+        year_str = year_str.mask(dates.str.contains("/", regex=False), dates.str.split("/").str[-1])
+        year_str = year_str.mask(dates.str.contains("-", regex=False), dates.str.split("-").str[0])
+        years = pd.to_numeric(year_str, errors="coerce")
+        years = years.where(years.between(1800, 2030))
+        return years.astype("Int64").astype(object).where(years.notna(), None)
+    
+    def _normalize_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Normalize NPPES organization rows (with all NPPES_SOURCE_COLS) to our schema, column by column."""
+        orgs = pd.DataFrame({dst: frame[src].str.strip() for src, dst in NPPES_FIELD_MAP})
+        orgs = orgs[orgs["company_name"] != ""]
         
-        return None
+        state = orgs["state"]
+        return orgs.assign(
+            domain=None,  # Will be enriched later
+            email=None,  # Will be enriched later
+            state=state.str.upper().astype(object).where(state != "", None),
+            country="US",
+            naics_code=None,  # Will be enriched later
+            # The license column often contains specialty info
+            industry=orgs["industry"].mask(orgs["industry"] == "", "Healthcare"),
+            founded_year=self._extract_years(orgs["enumeration_date"]),
+            years_in_business=None,  # Will be calculated
+            employee_count=None,
+            annual_revenue_usd=None,
+            business_size=None,
+            is_small_business=None,
+            source="nppes",
+            last_verified=None,  # Will be set by pipeline
+            quality_score=0,
+        )[list(ORGANIZATION_FIELDS)]
     
     def search_organizations(
         self,
@@ -265,32 +694,15 @@ class NPPESConnector:
             # Download and cache file
             zip_path = self._download_file(file_info["url"], file_info["filename"])
             
-            # Extract organizations
-            all_orgs = self._extract_organizations(zip_path)
-            
-            # Filter by states
-            filtered_orgs = []
-            for org in all_orgs:
-                if org.get("state") in [s.upper() for s in states]:
-                    filtered_orgs.append(org)
+            state_set = frozenset(s.upper() for s in states)
+            keyword_match = compile_keywords(keywords)
             
-            # Filter by keywords if provided
-            if keywords:
-                keyword_filtered = []
-                for org in filtered_orgs:
-                    org_text = " ".join([
-                        org.get("company_name", ""),
-                        org.get("industry", ""),
-                        org.get("taxonomy_code", "")
-                    ]).lower()
-                    
-                    if any(keyword.lower() in org_text for keyword in keywords):
-                        keyword_filtered.append(org)
-                
-                filtered_orgs = keyword_filtered
-            
-            # Limit results
-            result = filtered_orgs[:limit]
+            # Query the per-ZIP index; fall back to scanning the CSV if it can't be built
+            index_path = self._ensure_index(zip_path)
+            if index_path:
+                result = self._query_index(index_path, state_set, keyword_match, limit)
+            else:
+                result = self._extract_organizations(zip_path, state_set, keyword_match, limit)
             
             logger.info(f"NPPES search completed: {len(result)} organizations found")
             return result
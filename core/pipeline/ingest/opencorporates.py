@@ -8,20 +8,49 @@ Key params: q=free-text, jurisdiction_code=us_<state>, pagination
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
-import time
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from core.config import settings
-from core.schemas import BusinessPullRequest
+from core.httputil import AsyncRateLimiter, is_retryable_error, response_json, wait_retry_after
+from core.schemas import VALID_STATES, BusinessPullRequest
 
 logger = logging.getLogger(__name__)
 
 API_BASE = "https://api.opencorporates.com/v0.4/companies/search"
 MAX_PER_PAGE = 100  # API limit
+MAX_CONCURRENT_REQUESTS = 8
+STATE_TO_JURISDICTION = {state: f"us_{state.lower()}" for state in VALID_STATES}
+
+
+@lru_cache(maxsize=4096)
+def _extract_year(date_str: Optional[str]) -> Optional[int]:
+    """Extract year from date string; cached, as incorporation dates repeat heavily."""
+    if not date_str:
+        return None
+    
+    try:
+        # Handle various date formats
+        if "-" in date_str:
+            year = int(date_str.split("-")[0])
+        elif "/" in date_str:
+            year = int(date_str.split("/")[-1])
+        else:
+            year = int(date_str[:4])
+        
+        # Sanity check
+        if 1800 <= year <= 2030:
+            return year
+    except (ValueError, IndexError):
+        pass
+    
+    return None
 
 
 class OpenCorporatesConnector:
@@ -35,6 +64,9 @@ class OpenCorporatesConnector:
     def _map_state_to_jurisdiction(self, state: str) -> str:
         """Map 2-letter state code to OpenCorporates jurisdiction format."""
         state = state.upper().strip()
+        jurisdiction = STATE_TO_JURISDICTION.get(state)
+        if jurisdiction:
+            return jurisdiction
         if len(state) == 2:
             return f"us_{state.lower()}"
         return state
@@ -55,27 +87,141 @@ class OpenCorporatesConnector:
         return " ".join(query_parts)
     
     @retry(
+        retry=retry_if_exception(is_retryable_error),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
+        # Honour Retry-After on 429; otherwise back off exponentially with jitter
+        wait=wait_retry_after(wait_exponential_jitter(initial=1, max=10)),
+        reraise=True,
     )
-    def _make_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Make API request with retry logic."""
+    async def _get_page(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        limiter: AsyncRateLimiter,
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        async with semaphore:
+            async with limiter:
+                response = await client.get(API_BASE, params=params)
+        response.raise_for_status()
+        return response_json(response)
+    
+    async def _make_request(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        limiter: AsyncRateLimiter,
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Make API request, retrying network errors, 429 and 5xx."""
         if not self.api_key:
             return {"companies": []}
         
         try:
-            response = httpx.get(
-                API_BASE,
-                params=params,
-                timeout=30,
-                headers={"User-Agent": "DataForge/1.0"}
-            )
-            response.raise_for_status()
-            return response.json()
+            return await self._get_page(client, semaphore, limiter, params)
         except httpx.HTTPError as e:
             logger.error(f"OpenCorporates API request failed: {e}")
             return {"companies": []}
     
+    async def _search_state_async(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        limiter: AsyncRateLimiter,
+        state: str,
+        query: str,
+        limit: int,
+        per_page: int,
+        page: int = 1,
+    ) -> Tuple[List[Dict[str, Any]], int, bool]:
+        """Page through one state's results from ``page`` until ``limit`` companies are in.
+
+        ``per_page`` must stay the same across calls for one search so page
+        numbers line up. Returns the companies, the next page to ask for and
+        whether the state has run out of results.
+        """
+        jurisdiction = self._map_state_to_jurisdiction(state)
+        logger.info(f"Searching OpenCorporates for state: {state} (jurisdiction: {jurisdiction})")
+        
+        state_companies: List[Dict[str, Any]] = []
+        exhausted = False
+        while len(state_companies) < limit:
+            params = {
+                "api_token": self.api_key,
+                "q": query,
+                "jurisdiction_code": jurisdiction,
+                "per_page": per_page,
+                "page": page
+            }
+            
+            # Log params without exposing API key
+            safe_params = {k: v for k, v in params.items() if k != 'api_token'}
+            safe_params['api_token'] = '***' if self.api_key else None
+            logger.debug(f"OpenCorporates API call: {API_BASE} with params: {safe_params}")
+            
+            data = await self._make_request(client, semaphore, limiter, params)
+            companies = data.get("companies", [])
+            page += 1
+            
+            # Process and normalize company data; a page already paid for is kept whole
+            for company in companies:
+                normalized = self._normalize_company(company, state)
+                if normalized:
+                    state_companies.append(normalized)
+            
+            if len(companies) < per_page:
+                logger.info(f"No more companies found for {state} at page {page - 1}")
+                exhausted = True
+                break
+        
+        return state_companies, page, exhausted
+    
+    async def _search_companies_async(self, states: List[str], query: str, limit: int) -> List[Dict[str, Any]]:
+        if not states:
+            return []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        limiter = AsyncRateLimiter(settings.opencorp_requests_per_second)
+        per_page = min(MAX_PER_PAGE, limit)
+        # Each state gets an even share of the limit; states with more results
+        # are topped up only by what the others fell short, so requests
+        # against the monthly quota scale with the limit rather than limit x states
+        per_state: List[List[Dict[str, Any]]] = [[] for _ in states]
+        next_page = [1] * len(states)
+        open_states = list(range(len(states)))
+        budget = -(-limit // len(states))
+        # One pooled HTTP/2 client per search; every state and page reuses its connections
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            headers={"User-Agent": "DataForge/1.0"},
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_REQUESTS, max_keepalive_connections=MAX_CONCURRENT_REQUESTS
+            ),
+        ) as client:
+            while True:
+                fetched = await asyncio.gather(*(
+                    self._search_state_async(
+                        client, semaphore, limiter, states[i], query, budget, per_page, next_page[i]
+                    )
+                    for i in open_states
+                ))
+                still_open = []
+                for i, (companies, page, exhausted) in zip(open_states, fetched):
+                    per_state[i].extend(companies)
+                    next_page[i] = page
+                    if not exhausted:
+                        still_open.append(i)
+                open_states = still_open
+                
+                shortfall = limit - sum(len(companies) for companies in per_state)
+                if shortfall <= 0 or not open_states:
+                    break
+                budget = -(-shortfall // len(open_states))
+        
+        # Interleave the states round-robin so each contributes evenly
+        merged = itertools.chain.from_iterable(itertools.zip_longest(*per_state))
+        return [company for company in merged if company is not None][:limit]
+    
     def search_companies(
         self, 
         states: List[str], 
@@ -86,6 +232,9 @@ class OpenCorporatesConnector:
         """
         Search companies across multiple states.
         
+        States are searched concurrently, each for its share of ``limit``;
+        pages within a state are fetched in order.
+        
         Args:
             states: List of 2-letter state codes
             naics: Optional list of NAICS codes
@@ -99,58 +248,18 @@ class OpenCorporatesConnector:
             logger.info("OpenCorporates API key not available - returning empty results")
             return []
         
-        all_companies = []
         query = self._build_search_query(naics or [], keywords or [])
         
         if not query.strip():
             logger.warning("No search query built from NAICS/keywords - returning empty results")
             return []
         
-        for state in states:
-            jurisdiction = self._map_state_to_jurisdiction(state)
-            logger.info(f"Searching OpenCorporates for state: {state} (jurisdiction: {jurisdiction})")
-            
-            page = 1
-            while len(all_companies) < limit:
-                params = {
-                    "api_token": self.api_key,
-                    "q": query,
-                    "jurisdiction_code": jurisdiction,
-                    "per_page": min(MAX_PER_PAGE, limit - len(all_companies)),
-                    "page": page
-                }
-                
-                # Log params without exposing API key
-                safe_params = {k: v for k, v in params.items() if k != 'api_token'}
-                safe_params['api_token'] = '***' if self.api_key else None
-                logger.debug(f"OpenCorporates API call: {API_BASE} with params: {safe_params}")
-                
-                data = self._make_request(params)
-                companies = data.get("companies", [])
-                
-                if not companies:
-                    logger.info(f"No more companies found for {state} at page {page}")
-                    break
-                
-                # Process and normalize company data
-                for company in companies:
-                    if len(all_companies) >= limit:
-                        break
-                    
-                    normalized = self._normalize_company(company, state)
-                    if normalized:
-                        all_companies.append(normalized)
-                
-                page += 1
-                
-                # Rate limiting
-                time.sleep(0.1)
-                
-                if len(all_companies) >= limit:
-                    break
+        # Search each state once, even if the caller repeats it
+        states = list(dict.fromkeys(state.upper().strip() for state in states))
+        all_companies = asyncio.run(self._search_companies_async(states, query, limit))
         
         logger.info(f"OpenCorporates search completed: {len(all_companies)} companies found")
-        return all_companies[:limit]
+        return all_companies
     
     def _normalize_company(self, company: Dict[str, Any], state: str) -> Optional[Dict[str, Any]]:
         """Normalize OpenCorporates company data to our schema."""
@@ -192,7 +301,7 @@ class OpenCorporatesConnector:
                 "country": "US",
                 "naics_code": None,  # Will be enriched later
                 "industry": None,    # Will be enriched later
-                "founded_year": self._extract_year(incorporation_date),
+                "founded_year": _extract_year(incorporation_date),
                 "years_in_business": None,  # Will be calculated
                 "employee_count": None,
                 "annual_revenue_usd": None,
@@ -209,28 +318,6 @@ class OpenCorporatesConnector:
         except Exception as e:
             logger.error(f"Error normalizing OpenCorporates company: {e}")
             return None
-    
-    def _extract_year(self, date_str: str) -> Optional[int]:
-        """Extract year from date string."""
-        if not date_str:
-            return None
-        
-        try:
-            # Handle various date formats
-            if "-" in date_str:
-                year = int(date_str.split("-")[0])
-            elif "/" in date_str:
-                year = int(date_str.split("/")[-1])
-            else:
-                year = int(date_str[:4])
-            
-            # Sanity check
-            if 1800 <= year <= 2030:
-                return year
-        except (ValueError, IndexError):
-            pass
-        
-        return None
 
 
 # Global instance
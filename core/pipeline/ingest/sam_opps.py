@@ -8,21 +8,36 @@ Key params: postedFrom, postedTo, ncode (NAICS), placeOfPerformance.state, notic
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
+import itertools
 import logging
-import time
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Dict, List, Optional, Any
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from core.config import settings
+from core.httputil import fetch_offset_pages, response_json, retry_page
 from core.schemas import RFPPullRequest
 
 logger = logging.getLogger(__name__)
 
 SAM_ENDPOINT = "https://api.sam.gov/opportunities/v1/search"
 MAX_PER_PAGE = 1000  # API limit
+MAX_CONCURRENT_PAGES = 8
+MOCK_RECORD_COUNT = 10  # Records generated when no API key is configured
+
+
+def _get_str(data: Dict[str, Any], key: str) -> str:
+    """Stripped string value of ``key``; "" when it is missing, null or not a string."""
+    value = data.get(key)
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _get_dict(data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Nested object under ``key``; {} when it is missing, null or not an object."""
+    value = data.get(key)
+    return value if isinstance(value, dict) else {}
 
 
 class SAMConnector:
@@ -33,29 +48,74 @@ class SAMConnector:
         if not self.api_key:
             logger.warning("SAM_API_KEY not set - SAM.gov connector will return mock data")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    def _make_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Make API request with retry logic."""
+    @retry_page
+    async def _get_page(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        async with semaphore:
+            response = await client.get(SAM_ENDPOINT, params=params)
+        response.raise_for_status()
+        return response_json(response)
+    
+    async def _make_request(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Make API request, retrying network errors, 429 and 5xx."""
         if not self.api_key:
             return {"opportunitiesData": []}
         
+        logger.debug(f"SAM.gov API call: {SAM_ENDPOINT} with params: {params}")
+        
         try:
-            headers = {"X-API-KEY": self.api_key}
-            response = httpx.get(
-                SAM_ENDPOINT,
-                headers=headers,
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
+            return await self._get_page(client, semaphore, params)
         except httpx.HTTPError as e:
             logger.error(f"SAM.gov API request failed: {e}")
             return {"opportunitiesData": []}
     
+    @staticmethod
+    def _total_records(data: Dict[str, Any]) -> Optional[int]:
+        """Total matches reported by the search, if present."""
+        try:
+            return int(data["totalRecords"])
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    async def _fetch_pages(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        base_params: Dict[str, Any],
+        limit: int,
+        start: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Fetch up to ``limit`` raw opportunities from offset ``start``, pages concurrently."""
+        def fetch_page(offset: int, count: int) -> Awaitable[Dict[str, Any]]:
+            return self._make_request(client, semaphore, {**base_params, "offset": offset, "limit": count})
+        
+        return await fetch_offset_pages(
+            fetch_page, "opportunitiesData", self._total_records, limit, MAX_PER_PAGE, MAX_CONCURRENT_PAGES,
+            start=start,
+        )
+    
+    @staticmethod
+    def _merge_cells(per_cell: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Interleave the cells round-robin so each contributes evenly, dropping repeats.
+
+        Cells overlap when a notice lists several NAICS codes or states.
+        """
+        seen_ids = set()
+        merged = []
+        for opportunity in itertools.chain.from_iterable(itertools.zip_longest(*per_cell)):
+            if opportunity is None:
+                continue
+            notice_id = opportunity.get("noticeId")
+            if notice_id:
+                if notice_id in seen_ids:
+                    continue
+                seen_ids.add(notice_id)
+            merged.append(opportunity)
+        return merged
+    
     def search_opportunities(
         self,
         states: List[str],
@@ -65,6 +125,21 @@ class SAMConnector:
         posted_to: Optional[str] = None,
         notice_type: str = "Solicitation",
         limit: int = 500
+    ) -> List[Dict[str, Any]]:
+        """Synchronous wrapper around search_opportunities_async."""
+        return asyncio.run(self.search_opportunities_async(
+            states, naics, keywords, posted_from, posted_to, notice_type, limit
+        ))
+    
+    async def search_opportunities_async(
+        self,
+        states: List[str],
+        naics: Optional[List[str]] = None,
+        keywords: Optional[List[str]] = None,
+        posted_from: Optional[str] = None,
+        posted_to: Optional[str] = None,
+        notice_type: str = "Solicitation",
+        limit: int = 500
     ) -> List[Dict[str, Any]]:
         """
         Search contract opportunities from SAM.gov.
@@ -93,102 +168,109 @@ class SAMConnector:
             posted_from = start_date.isoformat()
             posted_to = end_date.isoformat()
         
-        all_opportunities = []
-        
         # Build search parameters
-        params = {
+        base_params: Dict[str, Any] = {
             "postedFrom": posted_from,
             "postedTo": posted_to,
             "noticeType": notice_type,
-            "limit": min(MAX_PER_PAGE, limit),
-            "offset": 0
         }
         
-        # Add NAICS codes
-        if naics:
-            params["ncode"] = ",".join(naics)
-        
-        # Add states
-        if states:
-            params["placeOfPerformance.state"] = ",".join(states)
-        
         # Add keywords
         if keywords:
-            params["q"] = " ".join(keywords)
+            base_params["q"] = " ".join(keywords)
         
-        logger.info(f"Searching SAM.gov with params: {params}")
+        # One server-side filtered search per (state, NAICS) cell instead of
+        # a single OR-joined query
+        combos = list(itertools.product(states or [None], naics or [None]))
+        combo_params = []
+        for state, ncode in combos:
+            params = dict(base_params)
+            if state:
+                params["placeOfPerformance.state"] = state
+            if ncode:
+                params["ncode"] = ncode
+            combo_params.append(params)
         
-        # Paginate through results
-        while len(all_opportunities) < limit:
-            params["offset"] = len(all_opportunities)
-            params["limit"] = min(MAX_PER_PAGE, limit - len(all_opportunities))
-            
-            logger.debug(f"SAM.gov API call: {SAM_ENDPOINT} with params: {params}")
-            
-            data = self._make_request(params)
-            opportunities = data.get("opportunitiesData", [])
-            
-            if not opportunities:
-                logger.info(f"No more opportunities found at offset {params['offset']}")
-                break
-            
-            # Process and normalize opportunity data
-            for opportunity in opportunities:
-                if len(all_opportunities) >= limit:
-                    break
+        logger.info(f"Searching SAM.gov with {len(combo_params)} queries: {base_params}")
+        
+        semaphore = asyncio.Semaphore(settings.sam_concurrency or MAX_CONCURRENT_PAGES)
+        # Each cell gets an even share of the limit; cells that came back full
+        # are topped up only by what the others fell short, so the number of
+        # notices fetched scales with the limit rather than limit x cells
+        per_cell: List[List[Dict[str, Any]]] = [[] for _ in combo_params]
+        open_cells = list(range(len(combo_params)))
+        budget = -(-limit // len(combo_params))
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            headers={"X-API-KEY": self.api_key, "User-Agent": "DataForge/1.0"},
+        ) as client:
+            while True:
+                fetched = await asyncio.gather(*(
+                    self._fetch_pages(client, semaphore, combo_params[i], budget, start=len(per_cell[i]))
+                    for i in open_cells
+                ))
+                for i, opportunities in zip(open_cells, fetched):
+                    per_cell[i].extend(opportunities)
+                open_cells = [i for i, opportunities in zip(open_cells, fetched) if len(opportunities) == budget]
                 
-                normalized = self._normalize_opportunity(opportunity)
-                if normalized:
-                    all_opportunities.append(normalized)
-            
-            # Rate limiting
-            time.sleep(0.1)
-            
+                raw_opportunities = self._merge_cells(per_cell)
+                shortfall = limit - len(raw_opportunities)
+                if shortfall <= 0 or not open_cells:
+                    break
+                budget = -(-shortfall // len(open_cells))
+        
+        # Normalize once every page is in
+        all_opportunities = []
+        for opportunity in raw_opportunities:
             if len(all_opportunities) >= limit:
                 break
+            
+            normalized = self._normalize_opportunity(opportunity)
+            if normalized:
+                all_opportunities.append(normalized)
         
         logger.info(f"SAM.gov search completed: {len(all_opportunities)} opportunities found")
-        return all_opportunities[:limit]
+        return all_opportunities
     
     def _normalize_opportunity(self, opportunity: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Normalize SAM.gov opportunity data to our schema."""
         try:
             # Extract basic info
-            notice_id = opportunity.get("noticeId", "").strip()
+            notice_id = _get_str(opportunity, "noticeId")
             if not notice_id:
                 return None
             
-            title = opportunity.get("title", "").strip()
-            agency = opportunity.get("department", {}).get("name", "").strip()
+            title = _get_str(opportunity, "title")
+            agency = _get_str(_get_dict(opportunity, "department"), "name")
             
             # Extract NAICS
-            naics = opportunity.get("naicsCode", {}).get("code", "").strip()
+            naics = _get_str(_get_dict(opportunity, "naicsCode"), "code")
             
             # Extract solicitation info
-            solicitation_number = opportunity.get("solicitationNumber", "").strip()
-            notice_type = opportunity.get("noticeType", "").strip()
+            solicitation_number = _get_str(opportunity, "solicitationNumber")
+            notice_type = _get_str(opportunity, "noticeType")
             
             # Extract dates
-            posted_date = opportunity.get("postedDate", "").strip()
-            close_date = opportunity.get("responseDeadline", "").strip()
+            posted_date = _get_str(opportunity, "postedDate")
+            close_date = _get_str(opportunity, "responseDeadline")
             
             # Extract location
-            place_of_performance = opportunity.get("placeOfPerformance", {})
-            state = place_of_performance.get("state", "").strip()
+            state = _get_str(_get_dict(opportunity, "placeOfPerformance"), "state")
             
             # Extract description
-            description = opportunity.get("description", "").strip()
+            description = _get_str(opportunity, "description")
             
             # Extract URL
-            url = opportunity.get("uiLink", "").strip()
+            url = _get_str(opportunity, "uiLink")
             
             # Extract contact info
-            point_of_contact = opportunity.get("pointOfContact", {})
-            contact_name = point_of_contact.get("fullName", "").strip()
-            contact_email = point_of_contact.get("email", "").strip()
+            point_of_contact = _get_dict(opportunity, "pointOfContact")
+            contact_name = _get_str(point_of_contact, "fullName")
+            contact_email = _get_str(point_of_contact, "email")
             
             # Extract estimated value
-            estimated_value = opportunity.get("award", {}).get("awardAmount", 0)
+            estimated_value = _get_dict(opportunity, "award").get("awardAmount", 0)
             
             return {
                 "notice_id": notice_id,
@@ -225,33 +307,39 @@ class SAMConnector:
         """Generate mock data when API key is not available."""
         logger.info("Generating mock SAM.gov data")
         
+        count = min(limit, MOCK_RECORD_COUNT)
         today = dt.date.today()
-        mock_opportunities = []
+        # Per-row values that do not depend on the row are computed once
+        posted_dates = [(today - dt.timedelta(days=i)).isoformat() for i in range(count)]
+        close_dates = [(today + dt.timedelta(days=14 - i)).isoformat() for i in range(count)]
+        title_topic = keywords[0] if keywords else "Telehealth"
+        description_topic = keywords[0] if keywords else "telehealth"
         
-        for i in range(min(limit, 10)):  # Generate up to 10 mock records
-            state = states[i % len(states)] if states else "DC"
-            naics_code = naics[i % len(naics)] if naics else "541511"
-            
-            mock_opportunities.append({
+        return [
+            {
                 "notice_id": f"mock-{i+1:03d}",
-                "title": f"Mock {keywords[0] if keywords else 'Telehealth'} Services - {state}",
+                "title": f"Mock {title_topic} Services - {state}",
                 "agency": f"Mock Agency {i+1}",
                 "naics": naics_code,
                 "solicitation_number": f"MOCK-{i+1:04d}",
                 "notice_type": "Solicitation",
-                "posted_date": (today - dt.timedelta(days=i)).isoformat(),
-                "close_date": (today + dt.timedelta(days=14-i)).isoformat(),
+                "posted_date": posted_dates[i],
+                "close_date": close_dates[i],
                 "place_of_performance_state": state,
-                "description": f"Mock opportunity for {keywords[0] if keywords else 'telehealth'} services in {state}",
+                "description": f"Mock opportunity for {description_topic} services in {state}",
                 "url": f"https://sam.gov/opp/mock-{i+1:03d}",
                 "contact_name": f"Mock Officer {i+1}",
                 "contact_email": f"mock{i+1}@example.com",
                 "estimated_value": 100000 + (i * 50000),
                 "source": "sam.gov (mock)",
                 "last_checked": None
-            })
-        
-        return mock_opportunities
+            }
+            for i in range(count)
+            for state, naics_code in [(
+                states[i % len(states)] if states else "DC",
+                naics[i % len(naics)] if naics else "541511",
+            )]
+        ]
 
 
 # Global instance
@@ -270,6 +358,18 @@ def fetch_rfps(payload: RFPPullRequest) -> List[Dict]:
     )
 
 
+async def fetch_rfps_async(payload: RFPPullRequest) -> List[Dict]:
+    """fetch_rfps for callers already inside an event loop."""
+    return await sam_connector.search_opportunities_async(
+        states=payload.states,
+        naics=payload.naics,
+        keywords=payload.keywords,
+        posted_from=payload.posted_from.isoformat() if payload.posted_from else None,
+        posted_to=payload.posted_to.isoformat() if payload.posted_to else None,
+        limit=payload.limit
+    )
+
+
 def ingest_sam_opportunities(
     states: List[str],
     naics: Optional[List[str]] = None,
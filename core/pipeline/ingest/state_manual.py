@@ -6,14 +6,85 @@ Tag: source="state_manual:<STATE>"
 """
 import logging
 import csv
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, TextIO, Tuple
 import yaml
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # Optional speedup: pip install "dataforge[arrow]"
+    pa = None
+    pacsv = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 from core.config import settings
+from core.textmatch import KeywordMatcher, compile_keywords
 
 logger = logging.getLogger(__name__)
 
+SNIFF_SAMPLE_CHARS = 4096
+SNIFF_DELIMITERS = ",;\t|"
+
+
+@lru_cache(maxsize=64)
+def _read_mapper(mapper_file: Path, mtime_ns: int) -> Optional[Dict[str, str]]:
+    """Parse a mapper file; keyed on its mtime so edited or rewritten mappers are re-read."""
+    with open(mapper_file, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+@lru_cache(maxsize=64)
+def _compile_row_mapper(
+    layout: Tuple[Tuple[Any, Optional[int]], ...], state: str
+) -> Callable[[List[str]], Optional[Dict[str, Any]]]:
+    """Build a function turning a CSV row into a finished record, or None.
+
+    ``layout`` pairs each mapped field with its column index (None when the
+    column is missing from the file). Everything that does not depend on the
+    row (key order, defaults, which columns to read) is worked out here once,
+    so each row only copies a template dict and fills in its columns,
+    producing exactly what ``StateManualConnector._normalize_record`` would.
+    """
+    fields = dict(layout)
+    name_index = fields.get("company_name")
+    if name_index is None:
+        return lambda row: None
+
+    indexes = [index for _, index in layout if index is not None]
+    # A row too short to hold every mapped column is skipped
+    min_length = max(indexes) + 1
+    # The source tag always wins over a mapped "source" column
+    columns = tuple(
+        (field, index)
+        for field, index in fields.items()
+        if index is not None and field not in ("company_name", "source")
+    )
+
+    template: Dict[str, Any] = dict.fromkeys(fields)
+    template["source"] = f"state_manual:{state.upper()}"
+    for field, default in (("country", "US"), ("state", state.upper()), ("quality_score", 0)):
+        template.setdefault(field, default)
+
+    def map_row(row: List[str]) -> Optional[Dict[str, Any]]:
+        if len(row) < min_length:
+            return None
+        company_name = row[name_index].strip()
+        if not company_name:
+            return None
+        record = template.copy()
+        record["company_name"] = company_name
+        for field, index in columns:
+            record[field] = row[index].strip()
+        return record
+
+    return map_row
+
 
 class StateManualConnector:
     """Manual state CSV connector with YAML mapping."""
@@ -33,41 +104,29 @@ class StateManualConnector:
             return None
         
         try:
-            with open(mapper_file, 'r') as f:
-                mapper = yaml.safe_load(f)
-            return mapper
+            return _read_mapper(mapper_file, mapper_file.stat().st_mtime_ns)
         except Exception as e:
             logger.error(f"Error loading mapper for {state}: {e}")
             return None
     
-    def _find_csv_files(self, state: str) -> List[Path]:
-        """Find CSV files for a state."""
-        csv_files = []
-        
-        # Look for CSV files with state name
-        patterns = [
-            f"{state.lower()}_*.csv",
-            f"{state.upper()}_*.csv",
-            f"*{state.lower()}*.csv",
-            f"*{state.upper()}*.csv"
-        ]
-        
-        for pattern in patterns:
-            csv_files.extend(self.data_dir.glob(pattern))
-        
-        return csv_files
+    def _list_csv_files(self) -> List[Path]:
+        """All CSV files in the drop directory, in name order."""
+        return sorted(
+            path for path in self.data_dir.iterdir()
+            if path.suffix.lower() == ".csv" and path.is_file()
+        )
+    
+    def _find_csv_files(self, state: str, csv_files: Optional[List[Path]] = None) -> List[Path]:
+        """Find CSV files whose name contains the state code, in any case."""
+        if csv_files is None:
+            csv_files = self._list_csv_files()
+        
+        state_lower = state.lower()
+        return [path for path in csv_files if state_lower in path.stem.lower()]
     
-    def _normalize_record(self, row: Dict[str, str], mapper: Dict[str, str], state: str) -> Optional[Dict[str, Any]]:
-        """Normalize a CSV row using the mapper."""
+    def _normalize_record(self, normalized: Dict[str, Optional[str]], state: str) -> Optional[Dict[str, Any]]:
+        """Finish a CSV row already mapped to our field names."""
         try:
-            # Apply field mapping
-            normalized = {}
-            for our_field, csv_field in mapper.items():
-                if csv_field in row:
-                    normalized[our_field] = row[csv_field].strip()
-                else:
-                    normalized[our_field] = None
-            
             # Ensure we have a company name
             if not normalized.get("company_name"):
                 return None
@@ -104,6 +163,9 @@ class StateManualConnector:
             List of company records
         """
         all_companies = []
+        keyword_match = compile_keywords(keywords)
+        # List the drop directory once rather than globbing it per state
+        available_files = self._list_csv_files()
         
         for state in states:
             # Load mapper for this state
@@ -113,7 +175,7 @@ class StateManualConnector:
                 continue
             
             # Find CSV files for this state
-            csv_files = self._find_csv_files(state)
+            csv_files = self._find_csv_files(state, available_files)
             if not csv_files:
                 logger.info(f"No CSV files found for {state}")
                 continue
@@ -122,7 +184,7 @@ class StateManualConnector:
             
             for csv_file in csv_files:
                 try:
-                    companies = self._process_csv_file(csv_file, mapper, state, keywords, limit)
+                    companies = self._process_csv_file(csv_file, mapper, state, keyword_match, limit)
                     all_companies.extend(companies)
                     
                     if len(all_companies) >= limit:
@@ -144,50 +206,134 @@ class StateManualConnector:
         csv_file: Path,
         mapper: Dict[str, str],
         state: str,
-        keywords: Optional[List[str]] = None,
+        keyword_match: Optional[KeywordMatcher] = None,
         limit: int = 500
     ) -> List[Dict[str, Any]]:
         """Process a single CSV file."""
         companies = []
         
         try:
-            with open(csv_file, 'r', encoding='utf-8', errors='ignore') as f:
-                # Try to detect delimiter
-                sample = f.read(1024)
-                f.seek(0)
-                
-                sniffer = csv.Sniffer()
-                delimiter = sniffer.sniff(sample).delimiter
-                
-                reader = csv.DictReader(f, delimiter=delimiter)
-                
-                for row in reader:
-                    if len(companies) >= limit:
-                        break
-                    
-                    # Normalize the record
-                    normalized = self._normalize_record(row, mapper, state)
-                    if not normalized:
-                        continue
-                    
-                    # Filter by keywords if provided
-                    if keywords:
-                        company_text = " ".join([
-                            normalized.get("company_name", ""),
-                            normalized.get("industry", ""),
-                            normalized.get("naics_code", "")
-                        ]).lower()
-                        
-                        if not any(keyword.lower() in company_text for keyword in keywords):
-                            continue
-                    
-                    companies.append(normalized)
+            delimiter = self._sniff_delimiter(csv_file)
+            
+            if pacsv is not None:
+                try:
+                    self._collect_rows(
+                        self._read_rows_arrow(csv_file, mapper, state, delimiter),
+                        companies, keyword_match, limit
+                    )
+                    return companies
+                except pa.ArrowInvalid as e:
+                    # Ragged rows, stray bytes and the like: re-read leniently below
+                    logger.debug(f"Arrow could not parse {csv_file}, using the csv module: {e}")
+                    companies.clear()
+            
+            with open(csv_file, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+                self._collect_rows(
+                    self._read_rows_csv(f, mapper, state, delimiter),
+                    companies, keyword_match, limit
+                )
         
         except Exception as e:
             logger.error(f"Error reading CSV file {csv_file}: {e}")
         
         return companies
     
+    def _sniff_delimiter(self, csv_file: Path) -> str:
+        """Detect the delimiter from the start of the file."""
+        with open(csv_file, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+            sample = f.read(SNIFF_SAMPLE_CHARS)
+        
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=SNIFF_DELIMITERS).delimiter
+        except csv.Error:
+            return ","  # Sniffing fails on e.g. single-column files
+    
+    def _collect_rows(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        companies: List[Dict[str, Any]],
+        keyword_match: Optional[KeywordMatcher],
+        limit: int
+    ) -> None:
+        """Append finished records that pass the keyword filter, up to limit."""
+        for normalized in rows:
+            if len(companies) >= limit:
+                break
+            
+            # Filter by keywords if provided
+            if keyword_match:
+                company_text = " ".join([
+                    normalized.get("company_name") or "",
+                    normalized.get("industry") or "",
+                    normalized.get("naics_code") or "",
+                ]).lower()
+                
+                if not keyword_match(company_text):
+                    continue
+            
+            companies.append(normalized)
+    
+    def _read_rows_csv(
+        self, f: TextIO, mapper: Dict[str, str], state: str, delimiter: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Records read with the csv module; tolerant of ragged rows and bad bytes."""
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        
+        # Resolve the mapped columns once and specialize the row mapping to
+        # them; fields whose column is missing from this file stay None
+        column_index = {name: i for i, name in enumerate(header)}
+        layout = tuple((field, column_index.get(column)) for field, column in mapper.items())
+        map_row = _compile_row_mapper(layout, state)
+        
+        for row in reader:
+            record = map_row(row)
+            if record is not None:
+                yield record
+    
+    def _read_rows_arrow(
+        self, csv_file: Path, mapper: Dict[str, str], state: str, delimiter: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Records from rows parsed by pyarrow's multi-threaded reader, in record batches.
+        
+        Only the mapped columns that exist in the file are decoded, all as
+        strings, and each row goes through the same row mapper as the csv
+        reader. Raises ``pyarrow.ArrowInvalid`` on input the csv module would
+        tolerate.
+        """
+        with open(csv_file, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+            header = next(csv.reader(f, delimiter=delimiter), None)
+        if header is None:
+            return
+        
+        present = set(header)
+        columns = list(dict.fromkeys(
+            column for column in mapper.values() if isinstance(column, str) and column in present
+        ))
+        # Row values come in ``columns`` order; missing columns map to None
+        column_index = {column: i for i, column in enumerate(columns)}
+        layout = tuple((field, column_index.get(column)) for field, column in mapper.items())
+        if dict(layout).get("company_name") is None:
+            return  # No row can produce a record
+        map_row = _compile_row_mapper(layout, state)
+        
+        reader = pacsv.open_csv(
+            csv_file,
+            parse_options=pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=columns,
+                column_types=dict.fromkeys(columns, pa.string()),
+            ),
+        )
+        
+        for batch in reader:
+            for row in zip(*(batch.column(column).to_pylist() for column in columns)):
+                record = map_row(row)
+                if record is not None:
+                    yield record
+    
     def create_sample_mapper(self, state: str) -> Path:
         """Create a sample mapper YAML file for a state."""
         sample_mapper = {
@@ -10,21 +10,25 @@ import usaddress
 from pydantic import ValidationError
 
 from core.schemas import BusinessCanonical, RFPCanonical
+from core.timeutil import utcnow
 
 
-def normalize_business_record(raw: Dict[str, Any]) -> BusinessCanonical:
+# A NANP area code never starts with 0 or 1
+NANP_LEADING_DIGITS = frozenset("23456789")
+
+
+def normalize_business_record(raw: Dict[str, Any], now: Optional[dt.datetime] = None) -> BusinessCanonical:
+    """Build a canonical business record; batch callers pass one shared ``now``."""
+    now = now or utcnow()
     state = (raw.get("state") or "").upper()
-    try:
-        parsed_address, _ = usaddress.tag(raw.get("address", ""))
-    except usaddress.RepeatedLabelError:
-        parsed_address = {}
+    parsed_address = _parse_address(raw)
 
     phone = normalize_phone(raw.get("phone"))
 
     founded_year = _coerce_int(raw.get("founded_year"))
     years_in_business = None
     if founded_year:
-        years_in_business = dt.datetime.utcnow().year - founded_year
+        years_in_business = now.year - founded_year
         years_in_business = max(years_in_business, 0)
 
     canonical = BusinessCanonical(
@@ -48,13 +52,28 @@ def normalize_business_record(raw: Dict[str, Any]) -> BusinessCanonical:
         business_size=_normalize_str(raw.get("business_size")),
         is_small_business=raw.get("is_small_business"),
         source=_normalize_str(raw.get("source")) or "unknown",
-        last_verified=_coerce_datetime(raw.get("last_verified")) or dt.datetime.utcnow(),
+        last_verified=_coerce_datetime(raw.get("last_verified")) or now,
         quality_score=int(raw.get("quality_score", 0) or 0),
     )
+    canonical._search_blob = build_search_blob(canonical)
     return canonical
 
 
-def normalize_rfp_record(raw: Dict[str, Any]) -> RFPCanonical:
+def _parse_address(raw: Dict[str, Any]) -> Dict[str, str]:
+    """Tag a free-text address, only when it can fill a missing city or ZIP."""
+    address = raw.get("address")
+    # usaddress runs a CRF model per call; skip it when there is nothing to fill
+    if not address or (raw.get("city") and raw.get("postal_code")):
+        return {}
+    try:
+        parsed_address, _ = usaddress.tag(address)
+    except usaddress.RepeatedLabelError:
+        return {}
+    return parsed_address
+
+
+def normalize_rfp_record(raw: Dict[str, Any], now: Optional[dt.datetime] = None) -> RFPCanonical:
+    """Build a canonical RFP record; batch callers pass one shared ``now``."""
     canonical = RFPCanonical(
         notice_id=str(raw.get("notice_id")),
         title=_normalize_str(raw.get("title")) or "Untitled",
@@ -71,17 +90,37 @@ def normalize_rfp_record(raw: Dict[str, Any]) -> RFPCanonical:
         contact_email=_normalize_str(raw.get("contact_email")),
         estimated_value=_normalize_str(raw.get("estimated_value")),
         source=_normalize_str(raw.get("source")) or "sam.gov",
-        last_checked=_coerce_datetime(raw.get("last_checked")) or dt.datetime.utcnow(),
+        last_checked=_coerce_datetime(raw.get("last_checked")) or now or utcnow(),
     )
     return canonical
 
 
+def build_search_blob(record: BusinessCanonical) -> str:
+    """Lowercased text that business keyword filters match against."""
+    return " ".join(
+        filter(
+            None,
+            (
+                record.company_name,
+                record.industry or "",
+                record.domain or "",
+                record.naics_code or "",
+            ),
+        )
+    ).lower()
+
+
 def normalize_phone(phone: Any) -> Optional[str]:
     if not phone:
         return None
     digits = "".join(filter(str.isdigit, str(phone)))
     if not digits:
         return None
+    # Plain NANP numbers come out the same as phonenumbers would produce, without parsing
+    if len(digits) == 10 and digits[0] in NANP_LEADING_DIGITS:
+        return "+1" + digits
+    if len(digits) == 11 and digits[0] == "1" and digits[1] in NANP_LEADING_DIGITS:
+        return "+" + digits
     try:
         parsed = phonenumbers.parse(digits, "US")
         if phonenumbers.is_possible_number(parsed):
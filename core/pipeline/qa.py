@@ -5,31 +5,60 @@ from __future__ import annotations
 import re
 from typing import Iterable, List
 
+import numpy as np
+
 from core.pipeline.export import BUSINESS_HEADER, RFP_HEADER
-from core.schemas import BusinessCanonical, QAReport, RFPCanonical
+from core.schemas import VALID_STATES, BusinessCanonical, QAReport, RFPCanonical
 
 
+# The 50 states plus DC, shared with request validation
+US_STATE_CODES = np.array(sorted(VALID_STATES))
 PHONE_PATTERN = re.compile(r"^\+?\d{10,11}$")
 FIPS_PATTERN = re.compile(r"^\d{5}$")
+STRIP_PLUS = str.maketrans("", "", "+")
 
 
 def run_business_qa(records: Iterable[BusinessCanonical], geocode_enabled: bool) -> QAReport:
     errors: List[str] = []
     records_list = list(records)
 
-    for record in records_list:
-        if record.state.upper() not in {"AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"}:
-            errors.append(f"Invalid state {record.state}")
-        if record.phone:
-            sanitized = record.phone.replace("+", "")
-            if not PHONE_PATTERN.match(sanitized):
-                errors.append(f"Bad phone {record.phone}")
-        if geocode_enabled and record.county_fips and not FIPS_PATTERN.match(record.county_fips):
-            errors.append(f"Invalid county_fips {record.county_fips}")
-        if record.founded_year and record.years_in_business is not None:
-            expected_years = max(0, record.last_verified.year - record.founded_year)
-            if abs(expected_years - record.years_in_business) > 1:
-                errors.append(f"years_in_business mismatch for {record.company_name}")
+    # Gather the checked fields into columns once, then compute each check as a mask
+    states = [record.state for record in records_list]
+    phones = [record.phone for record in records_list]
+    fips = [record.county_fips for record in records_list]
+    founded = np.array([record.founded_year or np.nan for record in records_list], dtype=float)
+    years = np.array(
+        [np.nan if record.years_in_business is None else record.years_in_business for record in records_list],
+        dtype=float,
+    )
+    verified = np.array([record.last_verified.year for record in records_list], dtype=float)
+
+    phone_match = PHONE_PATTERN.match
+    fips_match = FIPS_PATTERN.match
+
+    bad_state = ~np.isin(np.array([state.upper() for state in states], dtype=str), US_STATE_CODES)
+    bad_phone = np.array(
+        [bool(phone) and not phone_match(phone.translate(STRIP_PLUS)) for phone in phones], dtype=bool
+    )
+    bad_fips = np.array(
+        [geocode_enabled and bool(code) and not fips_match(code) for code in fips], dtype=bool
+    )
+    # NaN marks a missing founded year or years_in_business, and NaN comparisons are False
+    with np.errstate(invalid="ignore"):
+        expected_years = np.maximum(0, verified - founded)
+        bad_years = np.abs(expected_years - years) > 1
+
+    # Errors are reported per record in check order, so only offending rows are visited
+    any_bad = bad_state | bad_phone | bad_fips | bad_years
+    for i in np.flatnonzero(any_bad).tolist():
+        if bad_state[i]:
+            errors.append(f"Invalid state {states[i]}")
+        if bad_phone[i]:
+            errors.append(f"Bad phone {phones[i]}")
+        if bad_fips[i]:
+            errors.append(f"Invalid county_fips {fips[i]}")
+        if bad_years[i]:
+            errors.append(f"years_in_business mismatch for {records_list[i].company_name}")
     report = QAReport(
         passed=not errors,
         total_rows=len(records_list),
@@ -43,10 +72,14 @@ def run_rfp_qa(records: Iterable[RFPCanonical]) -> QAReport:
     errors: List[str] = []
     seen_notice_ids = set()
     records_list = list(records)
+    # Each id is hashed once: either it is new and recorded, or it is a duplicate
+    add_seen = seen_notice_ids.add
     for record in records_list:
-        if record.notice_id in seen_notice_ids:
-            errors.append(f"Duplicate notice_id {record.notice_id}")
-        seen_notice_ids.add(record.notice_id)
+        notice_id = record.notice_id
+        if notice_id in seen_notice_ids:
+            errors.append(f"Duplicate notice_id {notice_id}")
+        else:
+            add_seen(notice_id)
 
     report = QAReport(
         passed=not errors,
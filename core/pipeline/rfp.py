@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from pathlib import Path
 from typing import List
 
-from core.pipeline.ingest.sam_opps import fetch_rfps
-from core.pipeline.ingest.grants_gov import ingest_grants_gov
+from core.pipeline.ingest.sam_opps import fetch_rfps_async
+from core.pipeline.ingest.grants_gov import ingest_grants_gov_async
 from core.pipeline.normalize import normalize_rfp_record
 from core.pipeline.export import export_rfp_csv
 from core.pipeline.qa import run_rfp_qa
 from core.preview import rfp_preview_store
-from core.schemas import DataForgeResponse, RFPCanonical, RFPPullRequest
+from core.schemas import DataForgeResponse, RFPPullRequest
+from core.timeutil import utcnow
 
 
-def run_rfp_pipeline(payload: RFPPullRequest) -> DataForgeResponse:
-    raw_items = _ingest_rfps(payload)
-    normalized = [normalize_rfp_record(item) for item in raw_items]
+logger = logging.getLogger(__name__)
+
 
-    limited = normalized[: payload.limit]
+def run_rfp_pipeline(payload: RFPPullRequest) -> DataForgeResponse:
+    # Normalization is per record, so only the records that will be exported are normalized
+    raw_items = _ingest_rfps(payload)[: payload.limit]
+    # One timestamp for the whole batch keeps last_checked consistent across records
+    now = utcnow()
+    limited = [normalize_rfp_record(item, now) for item in raw_items]
     if not limited:
         return DataForgeResponse(ok=True, message="No RFP records found", export_path=None, qa_report=None)
 
@@ -33,26 +40,32 @@ def run_rfp_pipeline(payload: RFPPullRequest) -> DataForgeResponse:
 
 def _ingest_rfps(payload: RFPPullRequest) -> List[dict]:
     """Ingest RFP data from multiple sources."""
-    records = []
-    
-    # SAM.gov - Primary RFP source
-    try:
-        sam_records = fetch_rfps(payload)
-        records.extend(sam_records)
-    except Exception as e:
-        print(f"SAM.gov ingestion failed: {e}")
-    
-    # Grants.gov - Optional grants source
-    try:
-        grants_records = ingest_grants_gov(
+    return asyncio.run(_ingest_rfps_async(payload))
+
+
+async def _ingest_rfps_async(payload: RFPPullRequest) -> List[dict]:
+    """Fetch every RFP source concurrently; a source that fails contributes nothing."""
+    sources = {
+        # SAM.gov - Primary RFP source
+        "SAM.gov": fetch_rfps_async(payload),
+        # Grants.gov - Optional grants source
+        "Grants.gov": ingest_grants_gov_async(
             keywords=payload.keywords,
             posted_from=payload.posted_from.isoformat() if payload.posted_from else None,
             posted_to=payload.posted_to.isoformat() if payload.posted_to else None,
             limit=payload.limit
-        )
-        records.extend(grants_records)
-    except Exception as e:
-        print(f"Grants.gov ingestion failed: {e}")
+        ),
+    }
+    results = await asyncio.gather(*sources.values(), return_exceptions=True)
+    
+    records = []
+    for name, result in zip(sources, results):
+        if isinstance(result, Exception):
+            logger.error("%s ingestion failed: %s", name, result, exc_info=result)
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        records.extend(result)
     
     # Sort deterministically by notice_id
     records.sort(key=lambda r: (r.get("notice_id") or ""))
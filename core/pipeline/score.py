@@ -4,29 +4,40 @@ from __future__ import annotations
 
 from typing import Iterable, List
 
-from core.schemas import BusinessCanonical
-
-
-def score_business_records(records: Iterable[BusinessCanonical]) -> List[BusinessCanonical]:
-    scored = []
-    for record in records:
-        score = 100
-        if not record.domain:
-            score -= 20
-        if not record.phone:
-            score -= 10
-        if not record.address_line1:
-            score -= 10
-        if not record.naics_code:
-            score -= 10
-
-        # Email check stub; assume MX verified
-        if not record.email:
-            score -= 5
-
-        score = max(0, min(score, 100))
-        scored.append(record.model_copy(update={"quality_score": score}))
-    return scored
+import numpy as np
 
+from core.schemas import BusinessCanonical
 
 
+# Points deducted for each missing field, in SCORED_FIELDS order
+SCORED_FIELDS = ("domain", "phone", "address_line1", "naics_code", "email")
+MISSING_PENALTIES = np.array([20, 10, 10, 10, 5])  # Email check stub; assume MX verified
+
+
+def score_business_records(
+    records: Iterable[BusinessCanonical], in_place: bool = False
+) -> List[BusinessCanonical]:
+    """
+    Set quality_score on each record.
+
+    With ``in_place=True`` the records are updated directly instead of being
+    copied; use it when the caller owns the records.
+    """
+    records_list = list(records)
+    # One pass collects which scored fields are missing; the arithmetic is vectorized
+    missing = np.array(
+        [[not record.__dict__[field] for field in SCORED_FIELDS] for record in records_list],
+        dtype=bool,
+    ).reshape(-1, len(SCORED_FIELDS))
+    scores = np.clip(100 - missing @ MISSING_PENALTIES, 0, 100)
+
+    if not in_place:
+        return [
+            record.model_copy(update={"quality_score": score})
+            for record, score in zip(records_list, scores.tolist())
+        ]
+
+    # Scores are clamped ints, so plain assignment (validate_assignment is off) is safe
+    for record, score in zip(records_list, scores.tolist()):
+        record.quality_score = score
+    return records_list
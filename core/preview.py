@@ -2,69 +2,135 @@
 
 from __future__ import annotations
 
+import datetime as dt
+import hashlib
+import itertools
+import uuid
+from abc import ABC, abstractmethod
 from collections import deque
-from typing import Deque, Iterable, List
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
-from core.schemas import (
-    BusinessCanonical,
-    BusinessPreviewItem,
-    BusinessPreviewResponse,
-    PaginatedResponse,
-    PreviewQuery,
-    RFPCanonical,
-    RFPPreviewItem,
-    RFPPreviewResponse,
-)
+from pydantic import TypeAdapter
 
+from core.schemas import BusinessCanonical, PreviewQuery, RFPCanonical
+
+
+_PAGE_CACHE_SIZE = 256
+
+
+# The stores keep slim, slotted snapshots of the previewed fields rather than
+# whole canonical models, which carry a __dict__ and pydantic bookkeeping each.
+@dataclass(frozen=True, slots=True)
+class BusinessPreviewRow:
+    company_name: str
+    state: str
+    domain: Optional[str]
+    quality_score: Optional[int]
+
+    @classmethod
+    def from_record(cls, record: BusinessCanonical) -> BusinessPreviewRow:
+        return cls(record.company_name, record.state, record.domain, record.quality_score)
+
+
+@dataclass(frozen=True, slots=True)
+class RFPPreviewRow:
+    notice_id: str
+    title: str
+    agency: Optional[str]
+    posted_date: Optional[dt.date]
+
+    @classmethod
+    def from_record(cls, record: RFPCanonical) -> RFPPreviewRow:
+        return cls(record.notice_id, record.title, record.agency, record.posted_date)
+
+
+# Page shapes matching BusinessPreviewResponse / RFPPreviewResponse, over the stored rows
+@dataclass(frozen=True, slots=True)
+class _BusinessPage:
+    page: int
+    page_size: int
+    total: int
+    items: List[BusinessPreviewRow]
+
+
+@dataclass(frozen=True, slots=True)
+class _RFPPage:
+    page: int
+    page_size: int
+    total: int
+    items: List[RFPPreviewRow]
+
+
+class _PreviewStore(ABC):
+    # The page shape for this store's rows and the adapter dumping it to JSON
+    _page_type: Type
+    _page_adapter: TypeAdapter
 
-class _PreviewStore:
     def __init__(self, capacity: int = 500) -> None:
         self.capacity = capacity
         self._records: Deque = deque(maxlen=capacity)
+        # Bumped on every save; together with the per-process token it
+        # identifies the current contents for ETags and the page cache.
+        self.version = 0
+        self._token = uuid.uuid4().hex
+        self._json_cache: Dict[Tuple[int, int], bytes] = {}
 
     def save_records(self, records: Iterable) -> None:
-        for record in records:
-            self._records.appendleft(record)
-
-    def paginate(self, query: PreviewQuery, transform) -> PaginatedResponse:
+        # Only the newest `capacity` records survive, so only those are snapshotted.
+        # extendleft adds each at the front in turn, so the newest ends up first.
+        newest = list(records)[-self.capacity:]
+        self._records.extendleft(map(self._snapshot, newest))
+        self.version += 1
+        self._json_cache = {}
+
+    def etag(self, query: PreviewQuery) -> str:
+        key = f"{self._token}:{self.version}:{query.page}:{query.page_size}"
+        return '"' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '"'
+
+    def _page_rows(self, query: PreviewQuery) -> Iterator:
+        # Only the requested page is read; save_records adds newest-first
         start = (query.page - 1) * query.page_size
-        end = start + query.page_size
-        items = list(self._records)
-        return transform(items[start:end], total=len(items), query=query)
+        return itertools.islice(self._records, start, start + query.page_size)
+
+    @abstractmethod
+    def _snapshot(self, record: Any) -> Any:
+        """The slim row stored for ``record``."""
+
+    def list_records_json(self, query: PreviewQuery) -> bytes:
+        """The requested page as JSON, serialized once per store version.
+
+        The stored rows are dumped straight to JSON through ``_page_adapter``,
+        without building the per-item preview models.
+        """
+        key = (query.page, query.page_size)
+        cached = self._json_cache.get(key)
+        if cached is not None:
+            return cached
+
+        page = self._page_type(query.page, query.page_size, len(self._records), list(self._page_rows(query)))
+        body = self._page_adapter.dump_json(page)
+        cache = self._json_cache
+        if len(cache) >= _PAGE_CACHE_SIZE:
+            cache.clear()
+        cache[key] = body
+        return body
 
 
 class BusinessPreviewStore(_PreviewStore):
-    def list_records(self, query: PreviewQuery) -> BusinessPreviewResponse:
-        def build(records, total: int, query: PreviewQuery) -> BusinessPreviewResponse:
-            items = [
-                BusinessPreviewItem(
-                    company_name=record.company_name,
-                    state=record.state,
-                    domain=record.domain,
-                    quality_score=record.quality_score,
-                )
-                for record in records
-            ]
-            return BusinessPreviewResponse(page=query.page, page_size=query.page_size, total=total, items=items)
-
-        return self.paginate(query, build)
+    _page_type = _BusinessPage
+    _page_adapter = TypeAdapter(_BusinessPage)
+
+    def _snapshot(self, record: BusinessCanonical) -> BusinessPreviewRow:
+        return BusinessPreviewRow.from_record(record)
 
 
 class RFPPreviewStore(_PreviewStore):
-    def list_records(self, query: PreviewQuery) -> RFPPreviewResponse:
-        def build(records, total: int, query: PreviewQuery) -> RFPPreviewResponse:
-            items = [
-                RFPPreviewItem(
-                    notice_id=record.notice_id,
-                    title=record.title,
-                    agency=record.agency,
-                    posted_date=record.posted_date,
-                )
-                for record in records
-            ]
-            return RFPPreviewResponse(page=query.page, page_size=query.page_size, total=total, items=items)
-
-        return self.paginate(query, build)
+    _page_type = _RFPPage
+    _page_adapter = TypeAdapter(_RFPPage)
+
+    def _snapshot(self, record: RFPCanonical) -> RFPPreviewRow:
+        return RFPPreviewRow.from_record(record)
 
 
 business_preview_store = BusinessPreviewStore()
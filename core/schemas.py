@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import List, Optional, Union
+from typing import Annotated, FrozenSet, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator
 
 
-VALID_STATES = {
+VALID_STATES: FrozenSet[str] = frozenset({
     "AL",
     "AK",
     "AZ",
@@ -60,7 +60,7 @@ VALID_STATES = {
     "WI",
     "WY",
     "DC",
-}
+})
 
 
 class HealthResponse(BaseModel):
@@ -72,7 +72,7 @@ class QAReport(BaseModel):
     passed: bool
     total_rows: int
     dupes: int
-    errors: List[str] = []
+    errors: List[str] = Field(default_factory=list)
 
 
 class DataForgeResponse(BaseModel):
@@ -83,17 +83,34 @@ class DataForgeResponse(BaseModel):
 
 
 def _validate_states(states: List[str]) -> List[str]:
-    upper_states = [s.upper() for s in states]
-    invalid = [s for s in upper_states if s not in VALID_STATES]
+    # One pass uppercases and checks; the invalid list is only built on error
+    upper_states = []
+    invalid = None
+    for state in states:
+        upper = state.upper()
+        if upper not in VALID_STATES:
+            invalid = invalid or []
+            invalid.append(upper)
+        upper_states.append(upper)
     if invalid:
         raise ValueError(f"Invalid state codes: {', '.join(invalid)}")
     return upper_states
 
 
+def _strip_nonempty(values: Optional[List[str]]) -> Optional[List[str]]:
+    if values is None:
+        return None
+    return [s for s in (v.strip() for v in values) if s]
+
+
+# A list of strings with each entry stripped and blank entries dropped
+StrippedList = Annotated[Optional[List[str]], AfterValidator(_strip_nonempty)]
+
+
 class BusinessPullRequest(BaseModel):
     states: List[str]
-    naics: Optional[List[str]] = None
-    keywords: Optional[List[str]] = None
+    naics: StrippedList = None
+    keywords: StrippedList = None
     min_emp: Optional[int] = Field(default=None, ge=0)
     max_emp: Optional[int] = Field(default=None, ge=0)
     min_rev: Optional[int] = Field(default=None, ge=0)
@@ -109,18 +126,6 @@ class BusinessPullRequest(BaseModel):
     def check_states(cls, states: List[str]) -> List[str]:
         return _validate_states(states)
 
-    @field_validator("naics")
-    def normalize_naics(cls, values: Optional[List[str]]) -> Optional[List[str]]:
-        if values is None:
-            return None
-        return [v.strip() for v in values if v.strip()]
-
-    @field_validator("keywords")
-    def normalize_keywords(cls, values: Optional[List[str]]) -> Optional[List[str]]:
-        if values is None:
-            return None
-        return [v.strip() for v in values if v.strip()]
-    
     @field_validator("business_size")
     def validate_business_size(cls, value: Optional[str]) -> Optional[str]:
         if value is None:
@@ -133,8 +138,8 @@ class BusinessPullRequest(BaseModel):
 
 class RFPPullRequest(BaseModel):
     states: List[str]
-    naics: Optional[List[str]] = None
-    keywords: Optional[List[str]] = None
+    naics: StrippedList = None
+    keywords: StrippedList = None
     posted_from: Optional[dt.date] = None
     posted_to: Optional[dt.date] = None
     limit: int = Field(default=500, ge=1, le=10000)
@@ -144,25 +149,35 @@ class RFPPullRequest(BaseModel):
         return _validate_states(states)
 
     @field_validator("posted_to")
-    def validate_date_range(cls, posted_to: Optional[dt.date], values: dict) -> Optional[dt.date]:
-        posted_from = values.get("posted_from")
+    def validate_date_range(cls, posted_to: Optional[dt.date], info: ValidationInfo) -> Optional[dt.date]:
+        posted_from = info.data.get("posted_from")
         if posted_to and posted_from and posted_to < posted_from:
             raise ValueError("posted_to must be greater than or equal to posted_from")
         return posted_to
 
 
+# Preview models are built per request and never mutated or extended
+_PREVIEW_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+
 class PreviewQuery(BaseModel):
+    model_config = _PREVIEW_MODEL_CONFIG
+
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=25, ge=1, le=200)
 
 
 class PaginatedResponse(BaseModel):
+    model_config = _PREVIEW_MODEL_CONFIG
+
     page: int
     page_size: int
     total: int
 
 
 class BusinessPreviewItem(BaseModel):
+    model_config = _PREVIEW_MODEL_CONFIG
+
     company_name: str
     state: str
     domain: Optional[str] = None
@@ -174,6 +189,8 @@ class BusinessPreviewResponse(PaginatedResponse):
 
 
 class RFPPreviewItem(BaseModel):
+    model_config = _PREVIEW_MODEL_CONFIG
+
     notice_id: str
     title: str
     agency: Optional[str]
@@ -185,6 +202,10 @@ class RFPPreviewResponse(PaginatedResponse):
 
 
 class BusinessCanonical(BaseModel):
+    # Pipeline stages mutate records in place; keep assignment unvalidated and
+    # drop unknown connector keys rather than storing them per instance.
+    model_config = ConfigDict(extra="ignore", frozen=False, validate_assignment=False)
+
     company_name: str
     domain: Optional[str] = None
     phone: Optional[str] = None
@@ -208,6 +229,9 @@ class BusinessCanonical(BaseModel):
     last_verified: dt.datetime
     quality_score: int = 0
 
+    # Lowercased keyword-filter haystack, cached at normalization time
+    _search_blob: Optional[str] = PrivateAttr(default=None)
+
 
 class RFPCanonical(BaseModel):
     notice_id: str
@@ -0,0 +1,41 @@
+"""Multi-keyword substring matching shared by the ingest scans and filters."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup: pip install "dataforge[ahocorasick]"
+    ahocorasick = None
+
+
+KeywordMatcher = Callable[[str], bool]
+
+
+def compile_keywords(keywords: Optional[Iterable[str]]) -> Optional[KeywordMatcher]:
+    """Predicate telling whether lowercased text contains any keyword; None without keywords.
+
+    One Aho-Corasick automaton (or, without pyahocorasick, one regex
+    alternation) scans the text once however many keywords there are.
+    """
+    words = tuple(sorted({k.strip().lower() for k in keywords or () if k and k.strip()}))
+    if not words:
+        return None
+    return _compile_words(words)
+
+
+# Requests tend to repeat the same filters; the matchers are read-only, so share them
+@lru_cache(maxsize=256)
+def _compile_words(words: Tuple[str, ...]) -> KeywordMatcher:
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    search = re.compile("|".join(map(re.escape, words))).search
+    return lambda text: search(text) is not None
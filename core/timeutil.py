@@ -0,0 +1,13 @@
+"""Time helpers."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+
+def utcnow() -> dt.datetime:
+    """The current time as naive UTC, without the deprecated ``datetime.utcnow()``.
+
+    Naive to match the timezone-less record fields and database columns.
+    """
+    return dt.datetime.now(dt.UTC).replace(tzinfo=None)
@@ -1,7 +1,7 @@
 """Scheduled job runner for DataForge."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Dict, Any
 
 from apscheduler.schedulers.blocking import BlockingScheduler
@@ -10,6 +10,7 @@ from apscheduler.triggers.cron import CronTrigger
 from core.pipeline.business import run_business_pipeline
 from core.pipeline.rfp import run_rfp_pipeline
 from core.schemas import BusinessPullRequest, RFPPullRequest
+from core.timeutil import utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ def rfp_hourly_job():
     logger.info("Starting hourly RFP refresh")
     
     # Look for RFPs posted in the last hour
-    since = datetime.utcnow() - timedelta(hours=1)
+    since = utcnow() - timedelta(hours=1)
     
     payload = RFPPullRequest(
         states=["CA", "TX", "NY", "FL"],
@@ -2,10 +2,6 @@
 """Basic test script to verify DataForge core functionality without external dependencies."""
 
 import sys
-import os
-
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def test_imports():
     """Test that core modules can be imported."""
@@ -59,7 +55,7 @@ def test_schemas():
         print("✅ RFPPullRequest validation passed")
         
         # Test HealthResponse
-        health = HealthResponse(ok=True, ts=dt.datetime.utcnow())
+        health = HealthResponse(ok=True, ts=dt.datetime.now(dt.UTC))
         print("✅ HealthResponse validation passed")
         
         return True
@@ -107,28 +103,59 @@ def test_aws_utilities():
         print(f"❌ AWS utilities test failed: {e}")
         return False
 
+def test_pydantic_hotpath_perf():
+    """Report timings for the pydantic hot paths."""
+    print("\n🧪 Benchmarking pydantic hot paths...")
+    
+    try:
+        import timeit
+        from core.pipeline.normalize import normalize_business_record
+        from core.preview import BusinessPreviewStore
+        from core.schemas import BusinessPullRequest, PreviewQuery
+        
+        def best(fn, number):
+            return min(timeit.repeat(fn, number=number, repeat=3))
+        
+        # Validation vs model_construct, for reference: which one wins depends
+        # on the pydantic version and model size, so this is reported, not gated
+        rounds = 10000
+        validated = best(lambda: BusinessPullRequest(states=["CA"], limit=100), rounds)
+        constructed = best(lambda: BusinessPullRequest.model_construct(states=["CA"], limit=100), rounds)
+        print(f"✅ {rounds} BusinessPullRequest validations: {validated:.3f}s, model_construct: {constructed:.3f}s")
+        
+        # The preview API serializes pages straight from the stored rows.
+        # Timings depend on the machine and pydantic version, so this is
+        # reported, not gated. Saving no records leaves the contents alone
+        # but invalidates the page cache, so every round serializes afresh.
+        store = BusinessPreviewStore()
+        store.save_records(
+            normalize_business_record({"company_name": f"Company {i}", "state": "CA"}) for i in range(200)
+        )
+        query = PreviewQuery(page=1, page_size=200)
+        row_path = best(lambda: (store.save_records(()), store.list_records_json(query)), 200)
+        print(f"✅ 200 preview pages serialized: {row_path:.3f}s")
+        return True
+    except Exception as e:
+        print(f"❌ Pydantic benchmark failed: {e}")
+        return False
+
 def main():
     """Run all basic tests."""
     print("🚀 DataForge Basic Test Suite")
     print("=" * 50)
     
-    tests = [
+    tests = (
         test_imports,
         test_schemas,
         test_config,
         test_aws_utilities,
-    ]
+        test_pydantic_hotpath_perf,
+    )
     
-    passed = 0
+    # Run every test so one failure does not hide the others
+    passed = sum(1 for test in tests if test())
     total = len(tests)
     
-    for test in tests:
-        if test():
-            passed += 1
-        else:
-            print("❌ Test failed, stopping...")
-            break
-    
     print("\n" + "=" * 50)
     print(f"📊 Test Results: {passed}/{total} tests passed")
     
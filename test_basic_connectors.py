@@ -3,13 +3,9 @@
 Basic test script to verify DataForge connector structure without external dependencies.
 """
 
-import os
-import sys
 from pathlib import Path
 
-# Add the project root to Python path
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
 def test_file_structure():
     """Test that all connector files exist and have the right structure."""
@@ -5,12 +5,22 @@ This script demonstrates what happens when you try to pull real data from the AP
 """
 
 import os
-import sys
 from pathlib import Path
 
-# Add the project root to Python path
+import pytest
+
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+
+# Environment variables core.config reads the API keys from
+API_KEY_ENV_VARS = {
+    "OpenCorporates": "DATAFORGE_OPENCORP_API_KEY",
+    "SAM.gov": "DATAFORGE_SAM_API_KEY",
+}
+
+
+def _api_keys_in_env() -> bool:
+    return any(os.getenv(var) for var in API_KEY_ENV_VARS.values())
+
 
 def test_without_api_keys():
     """Test what happens without API keys (mock data)."""
@@ -52,6 +62,22 @@ def test_without_api_keys():
     except Exception as e:
         print(f"   ❌ Error: {e}")
 
+def test_api_key_status():
+    """Report which API keys are set, from the environment alone."""
+    print("\n🔑 API Key Status")
+    print("=" * 50)
+    
+    for name, var in API_KEY_ENV_VARS.items():
+        print(f"   {name}: {'✅ SET' if os.getenv(var) else '❌ NOT SET'}")
+    
+    if not _api_keys_in_env():
+        print("\n   ⚠️  No API keys configured - will use mock data")
+        print("   💡 To get real data:")
+        print("      - OpenCorporates: https://opencorporates.com/api_accounts/new")
+        print("      - SAM.gov: https://sam.gov/content/api-keys")
+
+# Decided at collection time, so runs without keys never load the settings
+@pytest.mark.skipif(not _api_keys_in_env(), reason="no API keys")
 def test_with_api_keys():
     """Test what happens with API keys (real data)."""
     print("\n🔑 Testing WITH API Keys (Real Data)")
@@ -60,21 +86,9 @@ def test_with_api_keys():
     try:
         from core.config import settings
         
-        # Check if API keys are configured
         opencorp_key = settings.opencorp_api_key
         sam_key = settings.sam_api_key
         
-        print(f"\n1️⃣  API Key Status")
-        print(f"   OpenCorporates: {'✅ SET' if opencorp_key else '❌ NOT SET'}")
-        print(f"   SAM.gov: {'✅ SET' if sam_key else '❌ NOT SET'}")
-        
-        if not opencorp_key and not sam_key:
-            print("\n   ⚠️  No API keys configured - will use mock data")
-            print("   💡 To get real data:")
-            print("      - OpenCorporates: https://opencorporates.com/api_accounts/new")
-            print("      - SAM.gov: https://sam.gov/content/api-keys")
-            return
-        
         # Test with actual API calls
         if opencorp_key:
             print(f"\n2️⃣  OpenCorporates Real Data Test")
@@ -123,13 +137,23 @@ def test_with_api_keys():
         print(f"   ❌ Error: {e}")
 
 def test_census_geocoder():
-    """Test Census Geocoder (no API key needed)."""
-    print("\n🌍 Testing Census Geocoder (No API Key Required)")
+    """Test Census Geocoder against the recorded response in tests/fixtures."""
+    print("\n🌍 Testing Census Geocoder (Recorded Response)")
     print("=" * 50)
     
     try:
-        from core.pipeline.enrich.geocode_census import census_geocoder
+        import json
+        import httpx
+        from core.pipeline.enrich.geocode_census import CensusGeocoder
         from core.schemas import BusinessCanonical
+        from core.timeutil import utcnow
+        
+        # Replay the recorded Census answer instead of calling the live API
+        recorded = json.loads((project_root / "tests" / "fixtures" / "census_1600_penn.json").read_text())
+        geocoder = CensusGeocoder()
+        geocoder._client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=recorded))
+        )
         
         # Test with a known address
         test_record = BusinessCanonical(
@@ -140,14 +164,15 @@ def test_census_geocoder():
             postal_code="20500",
             country="US",
             source="test",
-            last_verified=None,
+            last_verified=utcnow(),
             quality_score=0
         )
         
         print("\n1️⃣  Geocoding Test Address")
         print(f"   Input: {test_record.address_line1}, {test_record.city}, {test_record.state} {test_record.postal_code}")
         
-        geocoded = census_geocoder.geocode_record(test_record)
+        geocoded = geocoder.geocode_record(test_record)
+        geocoder.close()
         
         if geocoded.county or geocoded.county_fips:
             print(f"   ✅ Success: County={geocoded.county}, FIPS={geocoded.county_fips}")
@@ -212,7 +237,9 @@ def main():
     test_without_api_keys()
     
     # Test with API keys (real data)
-    test_with_api_keys()
+    test_api_key_status()
+    if _api_keys_in_env():
+        test_with_api_keys()
     
     # Test Census Geocoder (no key needed)
     test_census_geocoder()
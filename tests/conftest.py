@@ -0,0 +1,100 @@
+"""Shared pytest fixtures."""
+
+import datetime as dt
+import importlib
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+# Fixture attribute -> (module, class) for each connector
+_CONNECTORS = {
+    "opencorp": ("core.pipeline.ingest.opencorporates", "OpenCorporatesConnector"),
+    "nppes": ("core.pipeline.ingest.nppes", "NPPESConnector"),
+    "sam": ("core.pipeline.ingest.sam_opps", "SAMConnector"),
+    "grants": ("core.pipeline.ingest.grants_gov", "GrantsGovConnector"),
+    "state_manual": ("core.pipeline.ingest.state_manual", "StateManualConnector"),
+    "geocoder": ("core.pipeline.enrich.geocode_census", "CensusGeocoder"),
+}
+
+
+class _LazyConnectors:
+    """Imports and builds each connector on first access, then keeps it."""
+
+    def __getattr__(self, name):
+        try:
+            module_name, class_name = _CONNECTORS[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        connector = getattr(importlib.import_module(module_name), class_name)()
+        setattr(self, name, connector)
+        return connector
+
+
+@pytest.fixture(scope="session")
+def connectors():
+    """One instance of each connector per session; only the ones a test touches are imported."""
+    return _LazyConnectors()
+
+
+@pytest.fixture
+def geocoder_mock():
+    """A Census geocoder whose client replays the recorded 1600 Pennsylvania Ave response.
+
+    Only the one-line address endpoint has a recording; any other request
+    gets an empty match list. Sent requests are kept on ``geocoder.requests``.
+    """
+    from core.pipeline.enrich.geocode_census import ONELINE_URL, CensusGeocoder
+
+    recorded = json.loads((FIXTURES_DIR / "census_1600_penn.json").read_text())
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if str(request.url.copy_with(query=None)) == ONELINE_URL:
+            return httpx.Response(200, json=recorded)
+        return httpx.Response(200, json={"result": {"addressMatches": []}})
+
+    geocoder = CensusGeocoder()
+    geocoder._client = httpx.Client(transport=httpx.MockTransport(handler))
+    geocoder.requests = requests
+    yield geocoder
+    geocoder.close()
+
+
+@pytest.fixture(scope="module")
+def merge_times():
+    """Fixed ``older`` / ``now`` / ``newer`` timestamps, a day apart."""
+    now = dt.datetime(2024, 1, 15, 12, 0, 0)
+    return SimpleNamespace(older=now - dt.timedelta(days=1), now=now, newer=now + dt.timedelta(days=1))
+
+
+@pytest.fixture(scope="module")
+def sample_businesses():
+    """A micro, small, medium and large business, validated once per module.
+
+    Shared across tests: use ``model_copy(update=...)`` rather than mutating.
+    """
+    from core.schemas import BusinessCanonical
+
+    verified = dt.datetime(2024, 1, 1)
+    return [
+        BusinessCanonical(company_name="Micro Corp", state="CA", employee_count=5, source="test", last_verified=verified),
+        BusinessCanonical(company_name="Small Corp", state="CA", employee_count=25, source="test", last_verified=verified),
+        BusinessCanonical(company_name="Medium Corp", state="CA", employee_count=100, source="test", last_verified=verified),
+        BusinessCanonical(company_name="Large Corp", state="CA", employee_count=500, source="test", last_verified=verified),
+    ]
+
+
+@pytest.fixture(scope="module")
+def classified_businesses(sample_businesses):
+    """``sample_businesses`` with business size classification applied once."""
+    from core.pipeline.business_size import apply_business_size_classification
+
+    return [apply_business_size_classification(record) for record in sample_businesses]
@@ -6,52 +6,36 @@ from core.pipeline.business_size import classify_business_size, apply_business_s
 from core.pipeline.business import _apply_filters
 
 
-def test_classify_business_size_by_employees():
+@pytest.mark.parametrize(
+    "employees,expected_size,expected_small",
+    [
+        (5, "micro", True),
+        (25, "small", True),
+        (100, "medium", False),
+        (500, "large", False),
+    ],
+)
+def test_classify_business_size_by_employees(employees, expected_size, expected_small):
     """Test business size classification by employee count."""
-    
-    # Micro business
-    size, is_small = classify_business_size(5, None)
-    assert size == "micro"
-    assert is_small is True
-    
-    # Small business
-    size, is_small = classify_business_size(25, None)
-    assert size == "small"
-    assert is_small is True
-    
-    # Medium business
-    size, is_small = classify_business_size(100, None)
-    assert size == "medium"
-    assert is_small is False
-    
-    # Large business
-    size, is_small = classify_business_size(500, None)
-    assert size == "large"
-    assert is_small is False
-
-
-def test_classify_business_size_by_revenue():
+    size, is_small = classify_business_size(employees, None)
+    assert size == expected_size
+    assert is_small is expected_small
+
+
+@pytest.mark.parametrize(
+    "revenue,expected_size,expected_small",
+    [
+        (500_000, "micro", True),
+        (5_000_000, "small", True),
+        (25_000_000, "medium", False),
+        (100_000_000, "large", False),
+    ],
+)
+def test_classify_business_size_by_revenue(revenue, expected_size, expected_small):
     """Test business size classification by revenue when no employee count."""
-    
-    # Micro business by revenue
-    size, is_small = classify_business_size(None, 500_000)
-    assert size == "micro"
-    assert is_small is True
-    
-    # Small business by revenue
-    size, is_small = classify_business_size(None, 5_000_000)
-    assert size == "small"
-    assert is_small is True
-    
-    # Medium business by revenue
-    size, is_small = classify_business_size(None, 25_000_000)
-    assert size == "medium"
-    assert is_small is False
-    
-    # Large business by revenue
-    size, is_small = classify_business_size(None, 100_000_000)
-    assert size == "large"
-    assert is_small is False
+    size, is_small = classify_business_size(None, revenue)
+    assert size == expected_size
+    assert is_small is expected_small
 
 
 def test_classify_business_size_no_data():
@@ -93,21 +77,11 @@ def test_classify_by_naics_and_size():
     assert classified.is_small_business is True
 
 
-def test_small_business_filter():
+def test_small_business_filter(classified_businesses):
     """Test filtering for small businesses only."""
-    records = [
-        BusinessCanonical(company_name="Micro Corp", state="CA", employee_count=5, source="test"),
-        BusinessCanonical(company_name="Small Corp", state="CA", employee_count=25, source="test"),
-        BusinessCanonical(company_name="Medium Corp", state="CA", employee_count=100, source="test"),
-        BusinessCanonical(company_name="Large Corp", state="CA", employee_count=500, source="test"),
-    ]
-    
-    # Apply business size classification
-    classified = [apply_business_size_classification(record) for record in records]
-    
     # Filter for small businesses only
     payload = BusinessPullRequest(states=["CA"], small_business_only=True, limit=100)
-    filtered = _apply_filters(classified, payload)
+    filtered = _apply_filters(classified_businesses, payload)
     
     assert len(filtered) == 2
     assert all(record.is_small_business for record in filtered)
@@ -115,27 +89,24 @@ def test_small_business_filter():
     assert any(record.company_name == "Small Corp" for record in filtered)
 
 
-def test_specific_business_size_filter():
+def test_specific_business_size_filter(classified_businesses):
     """Test filtering for specific business size."""
-    records = [
-        BusinessCanonical(company_name="Micro Corp", state="CA", employee_count=5, source="test"),
-        BusinessCanonical(company_name="Small Corp", state="CA", employee_count=25, source="test"),
-        BusinessCanonical(company_name="Medium Corp", state="CA", employee_count=100, source="test"),
-        BusinessCanonical(company_name="Large Corp", state="CA", employee_count=500, source="test"),
-    ]
-    
-    # Apply business size classification
-    classified = [apply_business_size_classification(record) for record in records]
-    
     # Filter for medium businesses only
     payload = BusinessPullRequest(states=["CA"], business_size="medium", limit=100)
-    filtered = _apply_filters(classified, payload)
+    filtered = _apply_filters(classified_businesses, payload)
     
     assert len(filtered) == 1
     assert filtered[0].company_name == "Medium Corp"
     assert filtered[0].business_size == "medium"
 
 
+def test_apply_filters_noop_is_identity(classified_businesses):
+    """Without any filter set, the record list is returned as-is."""
+    payload = BusinessPullRequest(states=["CA"], limit=100)
+    
+    assert _apply_filters(classified_businesses, payload) is classified_businesses
+
+
 def test_business_size_validation():
     """Test business size validation in schema."""
     # Valid business size
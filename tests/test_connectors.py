@@ -0,0 +1,271 @@
+"""Test that the DataForge connectors import, initialize and work offline."""
+
+import httpx
+import pytest
+
+from core.schemas import BusinessCanonical, BusinessPullRequest, RFPPullRequest
+from core.timeutil import utcnow
+
+
+# (status, results expected); 401/403 are what the keyed APIs answer for a
+# missing or bad API key, and the connectors degrade to an empty page
+REQUEST_CASES = [(200, 1), (401, 0), (403, 0)]
+
+
+def _run_request(connector, status, body, params, rate_limited=False):
+    """Send one request through ``connector._make_request`` against a canned response.
+
+    Returns the connector's result and how many requests reached the transport.
+    """
+    import asyncio
+
+    from core.httputil import AsyncRateLimiter
+
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        if status == 200:
+            return httpx.Response(200, json=body)
+        return httpx.Response(status, json={"error": "API key required"})
+
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            args = (AsyncRateLimiter(100.0),) if rate_limited else ()
+            return await connector._make_request(client, asyncio.Semaphore(1), *args, params)
+
+    return asyncio.run(run()), len(sent)
+
+
+@pytest.mark.parametrize("name", ["opencorp", "nppes", "sam", "grants", "state_manual", "geocoder"])
+def test_connector_initialization(connectors, name):
+    """Each connector imports and can be constructed."""
+    assert getattr(connectors, name) is not None
+
+
+def test_geocoder_enabled(connectors):
+    """The Census geocoder needs no API key, so it is always enabled."""
+    assert connectors.geocoder.enabled
+
+
+@pytest.mark.parametrize("status,expected", REQUEST_CASES)
+def test_sam_request_path(connectors, monkeypatch, status, expected):
+    """SAM.gov returns the page on 200 and an empty page, without retrying, on 401/403."""
+    monkeypatch.setattr(connectors.sam, "api_key", "test-key")
+    body = {"totalRecords": 1, "opportunitiesData": [{"noticeId": "N1"}]}
+
+    data, sent = _run_request(
+        connectors.sam, status, body, {"postedFrom": "01/01/2024", "postedTo": "01/31/2024"}
+    )
+
+    assert len(data["opportunitiesData"]) == expected
+    assert sent == 1
+
+
+@pytest.mark.parametrize("status,expected", REQUEST_CASES)
+def test_opencorp_request_path(connectors, monkeypatch, status, expected):
+    """OpenCorporates returns the page on 200 and no companies, without retrying, on 401/403."""
+    monkeypatch.setattr(connectors.opencorp, "api_key", "test-key")
+    body = {"companies": [{"company": {"name": "Acme Health LLC"}}]}
+
+    data, sent = _run_request(
+        connectors.opencorp, status, body, {"q": "test", "jurisdiction_code": "us_ca"}, rate_limited=True
+    )
+
+    assert len(data["companies"]) == expected
+    assert sent == 1
+
+
+@pytest.fixture
+def opencorp_server(monkeypatch):
+    """An OpenCorporates connector talking to a fake search API; ``counts`` sets companies per state."""
+    from core.pipeline.ingest import opencorporates
+
+    server = {"counts": {}, "requests": 0}
+
+    def handler(request):
+        params = request.url.params
+        state = params["jurisdiction_code"][3:].upper()
+        page, per_page = int(params["page"]), int(params["per_page"])
+        first = (page - 1) * per_page
+        last = min(first + per_page, server["counts"].get(state, 0))
+        server["requests"] += 1
+        companies = [{"company": {"name": f"{state} Company {i}"}} for i in range(first, last)]
+        return httpx.Response(200, json={"companies": companies})
+
+    async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        opencorporates.httpx, "AsyncClient",
+        lambda **kwargs: async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    connector = opencorporates.OpenCorporatesConnector()
+    connector.api_key = "test-key"
+    server["connector"] = connector
+    return server
+
+
+def test_opencorp_search_splits_limit_across_states(opencorp_server):
+    """Each state pages only for its share of ``limit``, not for the whole limit."""
+    states = ["CA", "NY", "TX"]
+    opencorp_server["counts"] = {state: 500 for state in states}
+
+    results = opencorp_server["connector"].search_companies(states=states, keywords=["health"], limit=150)
+
+    assert len(results) == 150
+    assert {company["state"] for company in results} == set(states)
+    assert opencorp_server["requests"] == 3
+
+
+def test_opencorp_search_tops_up_from_fuller_states(opencorp_server):
+    """A state that runs short leaves its share to the states with more results."""
+    opencorp_server["counts"] = {"CA": 10, "NY": 1000}
+
+    results = opencorp_server["connector"].search_companies(states=["CA", "NY"], keywords=["health"], limit=300)
+
+    assert len(results) == 300
+    assert sum(company["state"] == "CA" for company in results) == 10
+    assert opencorp_server["requests"] == 4
+
+
+def test_mock_data_generation(connectors):
+    """SAM.gov generates mock data when no API key is configured."""
+    mock_data = connectors.sam._get_mock_data(
+        states=["CA", "TX"],
+        naics=["541511"],
+        keywords=["telehealth"],
+        limit=5
+    )
+
+    assert len(mock_data) == 5
+    assert mock_data[0]["title"] == "Mock telehealth Services - CA"
+
+
+def test_geocoding_functionality(geocoder_mock):
+    """The Census Geocoder resolves a known address to its county from the recorded response."""
+    test_record = BusinessCanonical(
+        company_name="Test Company",
+        address_line1="1600 Pennsylvania Ave",
+        city="Washington",
+        state="DC",
+        postal_code="20500",
+        country="US",
+        source="test",
+        last_verified=utcnow(),
+        quality_score=0
+    )
+
+    geocoded = geocoder_mock.geocode_record(test_record)
+
+    assert geocoded.county == "District of Columbia"
+    assert geocoded.county_fips == "11001"
+    [request] = geocoder_mock.requests
+    assert request.url.params["address"] == "1600 Pennsylvania Ave, Washington, DC, 20500"
+
+
+def test_batch_geocoding_names_counties(geocoder_mock, monkeypatch):
+    """Batch matches carry only the FIPS code; the name comes from one lookup per county."""
+    monkeypatch.setattr(geocoder_mock, "_get_cache", lambda: None)
+    monkeypatch.setattr(geocoder_mock, "_geocode_batch", lambda records: {i: "11001" for i in range(len(records))})
+    # Single lookups go through the mocked sync client instead of a fresh async one
+    monkeypatch.setattr(
+        geocoder_mock, "_geocode_individually", lambda records: [geocoder_mock.geocode_record(r) for r in records]
+    )
+    records = [
+        BusinessCanonical(
+            company_name=f"Company {i}", address_line1=f"{1600 + i} Pennsylvania Ave", city="Washington",
+            state="DC", postal_code="20500", source="test", last_verified=utcnow(),
+        )
+        for i in range(3)
+    ]
+
+    geocoded = geocoder_mock.geocode_records(records)
+
+    assert [(r.county, r.county_fips) for r in geocoded] == [("District of Columbia", "11001")] * 3
+    assert len(geocoder_mock.requests) == 1
+
+
+def test_nppes_member_inflates_like_zipfile(tmp_path):
+    """The ISA-L member reader returns the same bytes zipfile does."""
+    pytest.importorskip("isal")
+    import io
+    import zipfile
+
+    from core.pipeline.ingest.nppes import _IsalMemberReader, _open_member
+
+    zip_path = tmp_path / "npi.zip"
+    data = "".join(f"{i},Org {i},CA\n" for i in range(50_000)).encode()
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        zip_ref.writestr("readme.txt", "NPPES")
+        zip_ref.writestr("npidata.csv", data)
+
+    with zipfile.ZipFile(zip_path) as zip_ref, _open_member(zip_ref, zip_path, "npidata.csv") as member:
+        assert isinstance(member, _IsalMemberReader)
+        assert io.BufferedReader(member).read() == data
+
+
+def test_state_manual_setup(connectors):
+    """The state manual connector creates its directories and sample mappers."""
+    from core.pipeline.ingest.state_manual import create_sample_mapper
+
+    mapper_path = create_sample_mapper("CA")
+
+    assert mapper_path.exists()
+    assert connectors.state_manual.data_dir.exists()
+
+
+@pytest.mark.parametrize("row", [
+    [" Acme Health ", "12 Main St", "Fresno", "541511"],
+    ["Acme Health", "12 Main St"],
+    ["  ", "12 Main St", "Fresno", "541511"],
+])
+def test_state_manual_row_mapper_matches_normalize(connectors, row):
+    """The precompiled row mapper builds the same record as _normalize_record."""
+    from core.pipeline.ingest.state_manual import _compile_row_mapper
+
+    layout = (("company_name", 0), ("address_line1", 1), ("city", 2), ("naics_code", 3), ("phone", None))
+    expected = None
+    if len(row) > 3:
+        mapped = {field: None if index is None else row[index].strip() for field, index in layout}
+        expected = connectors.state_manual._normalize_record(mapped, "ca")
+
+    record = _compile_row_mapper(layout, "ca")(row)
+
+    assert record == expected
+    assert record is None or list(record) == list(expected)
+
+
+def test_state_manual_csv_and_arrow_readers_agree(connectors, tmp_path):
+    """Both CSV readers build identical records, including the source tag."""
+    pytest.importorskip("pyarrow")
+    csv_file = tmp_path / "ca_businesses.csv"
+    csv_file.write_text(
+        "Company Name,City,Origin,NAICS\n"
+        " Acme Health ,Fresno,upstream,541511\n"
+        ",Fresno,upstream,541511\n"
+        "Beta Care,,upstream,\n"
+    )
+    mapper = {"company_name": "Company Name", "city": "City", "source": "Origin", "naics_code": "NAICS", "phone": "Phone"}
+    state_manual = connectors.state_manual
+
+    with csv_file.open(newline="") as f:
+        from_csv = list(state_manual._read_rows_csv(f, mapper, "ca", ","))
+    from_arrow = list(state_manual._read_rows_arrow(csv_file, mapper, "ca", ","))
+
+    assert from_csv == from_arrow
+    assert [list(record) for record in from_csv] == [list(record) for record in from_arrow]
+    assert [record["source"] for record in from_csv] == ["state_manual:CA"] * 2
+
+
+def test_pipeline_integration():
+    """The pipelines import and their request schemas validate."""
+    from core.pipeline.business import run_business_pipeline
+    from core.pipeline.rfp import run_rfp_pipeline
+
+    biz_request = BusinessPullRequest(states=["CA"], keywords=["test"], limit=10)
+    rfp_request = RFPPullRequest(states=["CA"], keywords=["test"], limit=10)
+
+    assert callable(run_business_pipeline)
+    assert callable(run_rfp_pipeline)
+    assert biz_request.states == ["CA"]
+    assert rfp_request.keywords == ["test"]
@@ -51,34 +51,28 @@ def test_no_dedupe_different_zip():
     assert len(deduped) == 2
 
 
-def test_merge_policy_freshest_verified():
+def test_merge_policy_freshest_verified(merge_times):
     """Test merge policy prefers freshest last_verified."""
-    from datetime import datetime, timedelta
-    
-    now = datetime.utcnow()
-    older = now - timedelta(days=1)
-    newer = now + timedelta(days=1)
-    
     records = [
         BusinessCanonical(
             company_name="Company A", 
             domain="example.com", 
             state="CA", 
             source="test1",
-            last_verified=older
+            last_verified=merge_times.older
         ),
         BusinessCanonical(
             company_name="Company B", 
             domain="example.com", 
             state="CA", 
             source="test2",
-            last_verified=newer
+            last_verified=merge_times.newer
         ),
     ]
     
     deduped = dedupe_businesses(records)
     assert len(deduped) == 1
-    assert deduped[0].last_verified == newer
+    assert deduped[0].last_verified == merge_times.newer
 
 
 def test_merge_policy_keep_non_null():
@@ -7,7 +7,14 @@ from datetime import datetime
 
 import pytest
 from core.schemas import BusinessCanonical, BusinessPullRequest, RFPCanonical, RFPPullRequest
-from core.pipeline.export import export_business_csv, export_rfp_csv, BUSINESS_HEADER, RFP_HEADER
+from core.pipeline.export import (
+    export_business_csv,
+    export_rfp_csv,
+    iter_business_csv,
+    iter_rfp_csv,
+    BUSINESS_HEADER,
+    RFP_HEADER,
+)
 
 
 def test_business_csv_header_order():
@@ -72,6 +79,22 @@ def test_rfp_csv_deterministic_filename():
     assert filename.endswith(".csv")
 
 
+def test_long_filter_lists_get_short_unique_filenames():
+    """Past a few states or filters, the filename ends in a digest of the full list."""
+    from core.schemas import VALID_STATES
+    
+    records = [BusinessCanonical(company_name="Test Co", state="CA", source="test", last_verified=datetime(2024, 1, 1))]
+    states = sorted(VALID_STATES)
+    naics = [f"54{i:04d}" for i in range(40)]
+    
+    first = Path(export_business_csv(records, BusinessPullRequest(states=states, naics=naics, limit=100))).name
+    second = Path(export_business_csv(records, BusinessPullRequest(states=states, naics=naics[:-1], limit=100))).name
+    
+    assert len(first) < 80
+    assert "-".join(states[:3]) in first
+    assert first != second
+
+
 def test_business_csv_geocoder_fields():
     """Test that geocoder fields are included when present."""
     records = [
@@ -125,3 +148,49 @@ def test_business_csv_years_in_business():
         assert row[founded_idx] == "2020"
         assert row[years_idx] == "4"
 
+
+def test_streamed_csv_matches_export():
+    """The line-by-line CSV stream yields the same content as the export file."""
+    records = [
+        BusinessCanonical(company_name="Test Co", state="CA", source="test", last_verified=datetime(2024, 1, 1)),
+        BusinessCanonical(company_name="Other, Inc", state="TX", source="test", last_verified=datetime(2024, 1, 2)),
+    ]
+    payload = BusinessPullRequest(states=["CA", "TX"], limit=100)
+    
+    lines = list(iter_business_csv(records))
+    
+    assert len(lines) == 3
+    assert next(csv.reader(lines[:1])) == BUSINESS_HEADER
+    with open(export_business_csv(records, payload), newline="") as f:
+        assert "".join(lines) == f.read()
+
+
+def test_streamed_rfp_csv_is_lazy():
+    """The RFP stream pulls records from its input only as lines are consumed."""
+    consumed = []
+    
+    def records():
+        for i in range(3):
+            consumed.append(i)
+            yield RFPCanonical(notice_id=f"test-{i}", title="Test RFP", source="test", last_checked=datetime(2024, 1, 1))
+    
+    lines = iter_rfp_csv(records())
+    assert next(csv.reader([next(lines)])) == RFP_HEADER
+    assert consumed == []
+    next(lines)
+    assert consumed == [0]
+
+
+def test_business_parquet_companion(monkeypatch):
+    """With Parquet enabled, a zstd-compressed companion file sits next to the CSV."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    from core.config import settings
+    
+    monkeypatch.setattr(settings, "export_parquet", True)
+    records = [BusinessCanonical(company_name="Test Co", state="CA", source="test", last_verified=datetime(2024, 1, 1))]
+    payload = BusinessPullRequest(states=["CA"], limit=100)
+    
+    parquet_path = Path(export_business_csv(records, payload)).with_suffix(".parquet")
+    
+    assert pq.read_table(parquet_path).column("company_name").to_pylist() == ["Test Co"]
+    assert pq.read_metadata(parquet_path).row_group(0).column(0).compression == "ZSTD"
@@ -111,3 +111,64 @@ def test_rfp_schema_mapping():
     assert rfp.title == "Test RFP"
     assert rfp.source == "test"
 
+
+
+@pytest.fixture
+def sam_server(monkeypatch):
+    """A SAM connector talking to a fake search API; ``cells`` sets notices per state."""
+    import httpx
+    from core.pipeline.ingest import sam_opps
+    
+    server = {"cells": {}, "served": 0}
+    
+    def handler(request):
+        params = request.url.params
+        notices = server["cells"].get(params["placeOfPerformance.state"], [])
+        offset, limit = int(params["offset"]), int(params["limit"])
+        page = notices[offset : offset + limit]
+        server["served"] += len(page)
+        return httpx.Response(200, json={"totalRecords": len(notices), "opportunitiesData": page})
+    
+    async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        sam_opps.httpx, "AsyncClient",
+        lambda **kwargs: async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    connector = sam_opps.SAMConnector()
+    connector.api_key = "test-key"
+    server["connector"] = connector
+    return server
+
+
+def _notices(state, count):
+    return [
+        {"noticeId": f"{state}-{i}", "title": f"Notice {i}", "placeOfPerformance": {"state": {"code": state}}}
+        for i in range(count)
+    ]
+
+
+def test_sam_search_splits_limit_across_cells(sam_server):
+    """Every state cell contributes, and only about ``limit`` notices are fetched."""
+    states = ["CA", "NY", "TX"]
+    sam_server["cells"] = {state: _notices(state, 100) for state in states}
+    
+    results = sam_server["connector"].search_opportunities(
+        states=states, posted_from="2025-01-01", posted_to="2025-01-31", limit=9
+    )
+    
+    assert len(results) == 9
+    assert {r["notice_id"].split("-")[0] for r in results} == set(states)
+    assert sam_server["served"] == 9
+
+
+def test_sam_search_tops_up_from_fuller_cells(sam_server):
+    """A cell that runs short is made up from the others."""
+    sam_server["cells"] = {"CA": _notices("CA", 1), "NY": _notices("NY", 100)}
+    
+    results = sam_server["connector"].search_opportunities(
+        states=["CA", "NY"], posted_from="2025-01-01", posted_to="2025-01-31", limit=10
+    )
+    
+    assert len(results) == 10
+    assert sum(r["notice_id"].startswith("CA-") for r in results) == 1
+    assert sam_server["served"] == 10